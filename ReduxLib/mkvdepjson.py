@@ -103,10 +103,9 @@ if __name__ == "__main__":
             }
         ]
     }
-    print(json.dumps(template, indent=2))
+    payload = json.dumps(template, indent=2)
+    print(payload)
 
     if not local_flag:
-        with open(fileName, "w") as f:
-            json.dump(template, f, indent=2)
-        with open("build/allOutputs/" + fileName, "w") as f:
-            json.dump(template, f, indent=2)
\ No newline at end of file
+        pathlib.Path(fileName).write_text(payload)
+        pathlib.Path("build/allOutputs", fileName).write_text(payload)
\ No newline at end of file
@@ -2,18 +2,26 @@ import re
 import sys
 
 link_reg = re.compile(r"{@link (.*?)}")
+
+def link_to_doxygen(fmatch: re.Match) -> str:
+    fparts = fmatch[1].split("#")
+    if len(fparts) > 1 and fparts[1]:
+        return fparts[0] + "::" + fparts[1][0].upper() + fparts[1][1:]
+    return fmatch[1]
+
 if __name__ == "__main__":
     with open(sys.argv[1]) as f:
         file = f.read()
-    
-    fnew = file
-    for fmatch in link_reg.findall(file):
-        fmatch_new = fmatch
-        fparts = fmatch.split("#")
-        if len(fparts) > 1 and fparts[1]:
-            fmatch_new = fparts[0] + "::" + fparts[1][0].upper() + fparts[1][1:]
-        fnew = fnew.replace("{@link " + fmatch + "}", fmatch_new)
-        print("{@liink " + fmatch + "}", "->", fmatch_new)
-    
+
+    log = []
+    def repl(fmatch: re.Match) -> str:
+        fmatch_new = link_to_doxygen(fmatch)
+        log.append(f"{fmatch[0]} -> {fmatch_new}")
+        return fmatch_new
+
+    fnew = link_reg.sub(repl, file)
+    if log:
+        print("\n".join(log))
+
     with open(sys.argv[1], "w") as f:
         f.write(fnew)
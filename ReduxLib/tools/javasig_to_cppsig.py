@@ -1,23 +1,16 @@
-import re
 import sys
+from pathlib import Path
 
-if __name__ == "__main__":
-    with open(sys.argv[1]) as f:
-        file = f.read()
-    
-    nl = []
-    for line in file.splitlines():
-        sline = line.strip()
-        if sline.startswith("public ") and sline.endswith("{"):
-            sline = sline.replace("boolean", "bool")
-            parts = sline.split(" ")
-
-            lpad = (len(line) - len(line.lstrip())) * " "
+def javasig_to_cppsig(line: str) -> str:
+    """Rewrites a `public ... {` line into a C++ declaration; every other line passes through unchanged"""
+    sline = line.strip()
+    if not (sline.startswith("public ") and sline.endswith("{")):
+        return line
+    parts = sline.replace("boolean", "bool").split(" ")
+    lpad = (len(line) - len(line.lstrip())) * " "
+    cname = parts[2][0].upper() + parts[2][1:]
+    return lpad + " ".join([parts[1], cname] + parts[3:-1]) + ";"
 
-            cname = parts[2][0].upper() + parts[2][1:]
-            nl.append(lpad + " ".join([parts[1], cname] + parts[3:-1]) + ";")
-        else:
-            nl.append(line)
-    
-    with open(sys.argv[1], "w") as f:
-        f.write("\n".join(nl))
+if __name__ == "__main__":
+    path = Path(sys.argv[1])
+    path.write_text("\n".join(map(javasig_to_cppsig, path.read_text().splitlines())))
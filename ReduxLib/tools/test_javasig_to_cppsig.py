@@ -0,0 +1,30 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from javasig_to_cppsig import javasig_to_cppsig
+
+class JavasigToCppsigTest(unittest.TestCase):
+    def test_method_signatures(self):
+        cases = {
+            "    public double getPosition(int idx, boolean wait) {": "    double GetPosition(int idx, bool wait);",
+            "    public void close() throws Exception {": "    void Close() throws Exception;",
+            # the split is on spaces, so a generic return type with a space shifts which word gets capitalized
+            "    public Map<Integer, Long> getMap() {": "    Map<Integer, Long> getMap();",
+            # likewise for modifiers: the first word after public is kept as the return type
+            "    public static int getCount() {": "    static Int getCount();",
+            "    public synchronized boolean isReady() {": "    synchronized Bool isReady();",
+            "public class Foo {": "class Foo;",
+        }
+        for line, expected in cases.items():
+            with self.subTest(line=line):
+                self.assertEqual(javasig_to_cppsig(line), expected)
+
+    def test_other_lines_pass_through(self):
+        for line in ["    private int notPublic() {", "    public int field;", "", "    }"]:
+            with self.subTest(line=line):
+                self.assertEqual(javasig_to_cppsig(line), line)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,22 +2,45 @@
 Checks that the copyright header is on every source file and yells at you if it isn't.
 """
 import sys
-from pathlib import Path
+import os
 import itertools
+import typing
 copyright = """
 // Copyright (c) Bagholders of Redux Robotics and other contributors.
 // This is open source and can be modified and shared under the Mozilla Public License v2.0.
 """.strip()
+copyright_bytes = copyright.encode("utf-8")
+# CRLF files carry one extra byte per header line
+header_read_len = len(copyright_bytes) + copyright.count("\n")
+
+def has_copyright(p: str) -> bool:
+    """Reads only the first few bytes of the file rather than the whole thing."""
+    fd = os.open(p, os.O_RDONLY)
+    try:
+        head = os.read(fd, header_read_len)
+    finally:
+        os.close(fd)
+    return head.replace(b"\r\n", b"\n").startswith(copyright_bytes)
+
+def walk(base: str, exts: typing.Tuple[str, ...]) -> typing.Iterator[str]:
+    """Yields paths under base ending in one of exts, walking the tree once with os.scandir."""
+    if not os.path.isdir(base):
+        return
+    stack = [base]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for ent in it:
+                if ent.is_dir(follow_symlinks=False):
+                    stack.append(ent.path)
+                elif ent.name.endswith(exts):
+                    yield ent.path
 
 if __name__ == "__main__":
     ret = 0
-    root = Path(sys.argv[1])
-    for p in itertools.chain(root.glob("src/main/java/**/*.java"),
-                             root.glob("src/main/native/**/*.cpp"),
-                             root.glob("src/main/native/**/*.h")):
-        with open(p, "r") as f:
-            file_data = f.read()
-            if not file_data.startswith(copyright):
-                print(p, "lacks a copyright header!!!")
-                ret = 1
+    root = sys.argv[1]
+    for p in itertools.chain(walk(os.path.join(root, "src/main/java"), (".java",)),
+                             walk(os.path.join(root, "src/main/native"), (".cpp", ".h"))):
+        if not has_copyright(p):
+            print(p, "lacks a copyright header!!!")
+            ret = 1
     sys.exit(ret)
@@ -4,12 +4,11 @@ Extracts code snippets from javadocs, stuffs them into a robot project, and chec
 import bs4
 from pathlib import Path
 #import pprint
-import functools
 import dataclasses
 import typing
-import textwrap
 import shutil
 import os
+import re
 
 @dataclasses.dataclass
 class ClassName:
@@ -34,36 +33,34 @@ class DocEntry:
     # entry_text
     section: bs4.Tag
 
-    @classmethod
-    def f(cls, fname, id, section):
-        return cls(ClassName.from_fname(fname), id, section)
+SANITIZE_TABLE = str.maketrans({".": "_1"})
+# \w is exactly str.isalnum() plus the underscore
+NON_IDENT_REG = re.compile(r"[^\w$]")
 
 def sanitize_name(s: str) -> str:
-    v = []
-    for c in s:
-        if c.isalnum() or c in "$_":
-            v.append(c)
-        elif c == ".":
-            v.append("_1")
-        else:
-            v.append("_")
-    return "".join(v)
-
-def get_soup(fname: Path) -> bs4.BeautifulSoup:
+    return NON_IDENT_REG.sub("_", s.translate(SANITIZE_TABLE))
+
+def indent8(s: str) -> str:
+    """textwrap.indent(s, " " * 8) without the regex-driven line scan"""
+    return "".join("        " + ln if ln.strip() else ln for ln in s.splitlines(True))
+
+def get_soup(fname: Path, parse_only: typing.Optional[bs4.SoupStrainer] = None) -> bs4.BeautifulSoup:
     with open(fname, "r") as f:
-        return bs4.BeautifulSoup(f.read(), 'lxml')
+        return bs4.BeautifulSoup(f, 'lxml', parse_only=parse_only)
 
-def fetch_class_pages(jdoc_root: Path) -> typing.List[bs4.Tag]:
+# class pages are only ever inspected through their <section> tags
+SECTION_STRAINER = bs4.SoupStrainer("section")
+
+def get_class_soup(fname: Path) -> bs4.BeautifulSoup:
+    """Parses a class page, keeping only its <section> subtrees."""
+    return get_soup(fname, SECTION_STRAINER)
+
+def fetch_class_pages(jdoc_root: Path) -> typing.List[str]:
     """Extracts a list of class pages from the javadoc class index"""
     soup = get_soup(jdoc_root/"allclasses-index.html")
-    pages = set()
-
-    all_a = functools.reduce(lambda x, y: x + y, map(lambda x: x.find_all('a'), soup.find("div", id="all-classes-table").find_all("div", class_="col-first")))
-    for a in all_a:
-        pages.add(a['href'])
-    return list(pages)
+    return list({a['href'] for a in soup.select("#all-classes-table div.col-first a[href]")})
 
-def extract_doc_entries(jdoc_root: Path, fname: str) -> typing.List[DocEntry]:
+def extract_doc_entries(soup: bs4.BeautifulSoup, cname: ClassName) -> typing.List[DocEntry]:
     #<section class="class-description" id="class-description"> -- id = <description>
     #<section class="constructor-details" id="constructor-detail">
     #<section class="detail" id="&lt;init&gt;()">
@@ -74,16 +71,15 @@ def extract_doc_entries(jdoc_root: Path, fname: str) -> typing.List[DocEntry]:
 
     ents = []
 
-    soup = get_soup(jdoc_root/fname)
-    ents.append(DocEntry.f(fname, "<class>", soup.find("section", id="class-description")))
+    ents.append(DocEntry(cname, "<class>", soup.find("section", id="class-description")))
 
     if ctor_detail := soup.find("section", id="constructor-detail"):
         for ctor_section in ctor_detail.find_all("section", class_="detail"):
-            ents.append(DocEntry.f(fname, ctor_section['id'], ctor_section))
+            ents.append(DocEntry(cname, ctor_section['id'], ctor_section))
     
     if method_detail := soup.find("section", id="method-detail"):
         for method_section in method_detail.find_all("section", class_="detail"):
-            ents.append(DocEntry.f(fname, method_section['id'], method_section))
+            ents.append(DocEntry(cname, method_section['id'], method_section))
     
     return ents
 
@@ -102,7 +98,7 @@ def generate_source_file(jdoc_root: Path, page: str):
     <pre class="include-com_reduxrobotics_frames_*"> [code here] </pre>
     """
     cname = ClassName.from_fname(page)
-    doc_entries = extract_doc_entries(jdoc_root, page)
+    doc_entries = extract_doc_entries(get_class_soup(jdoc_root/page), cname)
     snippets: typing.List[str] = []
     imports = {f"import {cname.package}.*;"}
     snippet_class = sanitize_name(cname.name)
@@ -129,7 +125,7 @@ def generate_source_file(jdoc_root: Path, page: str):
             snippets.append(f"""
     /** From {snippet_class} */
     public static void {sanitize_name(snippet_class + "_" + ent.id)}_{idx}() {{
-{textwrap.indent(pre.get_text(), " " * 8)}
+{indent8(pre.get_text())}
     }}""")
 
     if not snippets:
@@ -154,7 +150,6 @@ def main(jdoc_root: Path):
     snippets_root.mkdir()
 
     for pg in pages:
-        #doc_entries = extract_doc_entries(jdoc_root, pg)
         name, src = generate_source_file(jdoc_root, pg)
         if not name:
             continue
@@ -5,6 +5,7 @@ import dataclasses
 import pathlib
 import struct
 from .toml_defs import DeviceSpec, EnumEntrySpec, EnumSpec
+from . import utils
 
 __all__ = [
     'UIntMeta',
@@ -25,10 +26,11 @@ __all__ = [
     'Device',
     'DType',
     'parse_spec',
-    'parse_spec_to_device'
+    'parse_spec_to_device',
+    'inject_setting_enums'
 ]
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UIntMeta:
     width: int
     min: Optional[int]
@@ -38,7 +40,7 @@ class UIntMeta:
     factor_den: int
     offset: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SIntMeta:
     width: int
     min: Optional[int]
@@ -48,7 +50,7 @@ class SIntMeta:
     factor_den: int
     offset: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FloatMeta:
     width: int
     min: Optional[float]
@@ -59,19 +61,26 @@ class FloatMeta:
     factor_den: int
     offset: float
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BitsetFlag:
     bit_idx: int
     default_value: bool
     name: str
     comment: str
+    # derived once when the flag is built, rather than by every code generator
+    mask: int = dataclasses.field(init=False)
+    upper_name: str = dataclasses.field(init=False)
 
-@dataclasses.dataclass
+    def __post_init__(self):
+        self.mask = 1 << self.bit_idx
+        self.upper_name = self.name.upper()
+
+@dataclasses.dataclass(slots=True)
 class BufMeta:
     width: int
     default_value: int # yeah this should _probably_ be bytes
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EnumMeta:
     name: str
     width: int
@@ -79,40 +88,54 @@ class EnumMeta:
     default_value_idx: int
     is_public: bool
     values: Dict[int, 'EnumEntry']
+    # the generated class name, converted once here rather than per signal that uses the type
+    camel_name: str = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.camel_name = utils.screaming_snake_to_camel(self.name)
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EnumEntry:
     name: str
     comment: str
     index: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StructMeta:
     name: str
     signals: List['Signal']
+    camel_name: str = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.camel_name = utils.screaming_snake_to_camel(self.name)
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BitsetMeta:
     name: str
     width: int
     flags: List[BitsetFlag]
+    # the flags' default values folded into one int, computed once when the bitset is built
+    _default_u64: int = dataclasses.field(init=False)
+    camel_name: str = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self._default_u64 = sum(int(flag.default_value) << flag.bit_idx for flag in self.flags)
+        self.camel_name = utils.screaming_snake_to_camel(self.name)
+
     def default_u64(self) -> int:
-        v = 0
-        for ent in self.flags:
-            v |= ent.default_value << ent.bit_idx
-        return v
+        return self._default_u64
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PadMeta:
     width: int
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BoolMeta:
     default_value: bool
 
 #DType = Union[None, UIntMeta, SIntMeta, BufMeta, FloatMeta, BitsetMeta, PadMeta, BoolMeta, EnumMeta, StructMeta]
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Signal:
     name: str
     comment: str
@@ -146,15 +169,18 @@ class Source(enum.StrEnum):
     Host = "Host"
     Both = "Both"
 
-    def from_str(s: str) -> Self:
-        return {
-            "device": Source.Device,
-            "host": Source.Host,
-            "bidir": Source.Both,
-            "both": Source.Both
-        }[s]
+    @staticmethod
+    def from_str(s: str) -> 'Source':
+        return _SOURCE_MAP[s]
+
+_SOURCE_MAP = {
+    "device": Source.Device,
+    "host": Source.Host,
+    "bidir": Source.Both,
+    "both": Source.Both
+}
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Message:
     id: int
     comment: str
@@ -164,7 +190,7 @@ class Message:
     is_public: bool
     signals: List[Signal]
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Setting:
     name: str
     id: int
@@ -177,7 +203,7 @@ class Setting:
     vdep_setting: bool
     special_flags: List[str]
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Device:
     name: str
     arch: str
@@ -194,94 +220,121 @@ class Device:
 
 DTypeOnion = Union[None, UIntMeta, SIntMeta, BufMeta, FloatMeta, BitsetMeta, PadMeta, BoolMeta, EnumMeta, StructMeta]
 class DType:
+    __slots__ = ("meta",)
+
     def __init__(self, meta: DTypeOnion):
         self.meta = meta
     
     def bit_length(self):
-        match self.meta:
-            case None:
-                return 0
-            case BoolMeta():
-                return 1
-            case StructMeta():
-                return sum(sig.dtype.bit_length() for sig in self.meta.signals)
-            case other:
-                return self.meta.width
+        return _BIT_LENGTH.get(type(self.meta), _width)(self.meta)
     
     def is_pad(self):
         return self.meta is None or isinstance(self.meta, PadMeta)
     
     def canonical_name(self):
-        match self.meta:
-            case UIntMeta():
-                return f"uint:{self.meta.width}"
-            case SIntMeta():
-                return f"sint:{self.meta.width}"
-            case FloatMeta():
-                return f"float:{self.meta.width}"
-            case BoolMeta():
-                return "bool"
-            case PadMeta():
-                return f"pad:{self.meta.width}"
-            case StructMeta():
-                return f"struct:{self.meta.name}"
-            case BitsetMeta():
-                return f"bitset:{self.meta.width}"
-            case BufMeta():
-                return f"buf:{self.meta.width}"
-            case EnumMeta():
-                return f"enum:{self.meta.name}"
-            case aaa:
-                raise ValueError(f"DType::None encountered: {aaa}")
+        try:
+            fmt = _CANONICAL_NAME[type(self.meta)]
+        except KeyError:
+            raise ValueError(f"DType::None encountered: {self.meta}") from None
+        return fmt.format(meta=self.meta)
 
     def default_value_as_bits(self) -> int:
-        meta = self.meta
-        match meta:
-            case UIntMeta():
-                return meta.default_value
-            case SIntMeta():
-                return meta.default_value
-            case FloatMeta():
-                match meta.width:
-                    case 24:
-                        return int.from_bytes(struct.pack("<f", meta.default_value), 'little') >> 8
-                    case 32:
-                        return int.from_bytes(struct.pack("<f", meta.default_value), 'little')
-                    case 64:
-                        return int.from_bytes(struct.pack("<d", meta.default_value), 'little')
-                    case _:
-                        raise ValueError(f"Float({meta.width}) invalid size!!!")
-            case BoolMeta():
-                return int(meta.default_value)
-            case PadMeta():
-                return 0
-            case StructMeta():
-                ivalue = 0
-                ishift = 0
-                for subsig in meta.signals:
-                    ivalue |= subsig.dtype.default_value_as_bits() << ishift
-                    ishift += subsig.dtype.bit_length()
-                return ivalue
-            case BitsetMeta():
-                return meta.default_u64()
-            case BufMeta():
-                return meta.default_value
-            case EnumMeta():
-                if meta.default_value:
-                    return meta.default_value_idx
-                else:
-                    return 0
-            case _:
-                return None
+        handler = _DEFAULT_VALUE_AS_BITS.get(type(self.meta))
+        if handler is None:
+            return None
+        return handler(self.meta)
+
+# DType methods dispatch on type(meta) through these tables rather than walking a match statement.
+
+def _width(meta) -> int:
+    return meta.width
+
+_BIT_LENGTH = {
+    type(None): lambda meta: 0,
+    BoolMeta: lambda meta: 1,
+    StructMeta: lambda meta: sum(sig.dtype.bit_length() for sig in meta.signals),
+}
+
+_CANONICAL_NAME = {
+    UIntMeta: "uint:{meta.width}",
+    SIntMeta: "sint:{meta.width}",
+    FloatMeta: "float:{meta.width}",
+    BoolMeta: "bool",
+    PadMeta: "pad:{meta.width}",
+    StructMeta: "struct:{meta.name}",
+    BitsetMeta: "bitset:{meta.width}",
+    BufMeta: "buf:{meta.width}",
+    EnumMeta: "enum:{meta.name}",
+}
+
+# scratch buffer the float packers write into, so no intermediate bytes object is made per call.
+# not thread-safe, but neither is anything else in the parser.
+_FLOAT_BUF = bytearray(8)
+_PACK_F_INTO = struct.Struct("<f").pack_into
+_PACK_D_INTO = struct.Struct("<d").pack_into
+_UNPACK_I_FROM = struct.Struct("<I").unpack_from
+_UNPACK_Q_FROM = struct.Struct("<Q").unpack_from
+
+def _f32_bits(v: float) -> int:
+    _PACK_F_INTO(_FLOAT_BUF, 0, v)
+    return _UNPACK_I_FROM(_FLOAT_BUF)[0]
+
+def _f64_bits(v: float) -> int:
+    _PACK_D_INTO(_FLOAT_BUF, 0, v)
+    return _UNPACK_Q_FROM(_FLOAT_BUF)[0]
+
+_FLOAT_AS_BITS = {
+    24: lambda v: _f32_bits(v) >> 8,
+    32: _f32_bits,
+    64: _f64_bits,
+}
+
+def _float_default_as_bits(meta: FloatMeta) -> int:
+    if meta.width not in _FLOAT_AS_BITS:
+        raise ValueError(f"Float({meta.width}) invalid size!!!")
+    return _FLOAT_AS_BITS[meta.width](meta.default_value)
+
+def _struct_default_and_width(meta: StructMeta) -> Tuple[int, int]:
+    # nested structs hand back their width with their bits, so bit_length() isn't re-summed at every level
+    ivalue = 0
+    ishift = 0
+    for subsig in meta.signals:
+        if type(subsig.dtype.meta) is StructMeta:
+            value, width = _struct_default_and_width(subsig.dtype.meta)
+        else:
+            value, width = subsig.dtype.default_value_as_bits(), subsig.dtype.bit_length()
+        ivalue |= value << ishift
+        ishift += width
+    return ivalue, ishift
+
+def _struct_default_as_bits(meta: StructMeta) -> int:
+    return _struct_default_and_width(meta)[0]
+
+_DEFAULT_VALUE_AS_BITS = {
+    UIntMeta: lambda meta: meta.default_value,
+    SIntMeta: lambda meta: meta.default_value,
+    FloatMeta: _float_default_as_bits,
+    BoolMeta: lambda meta: int(meta.default_value),
+    PadMeta: lambda meta: 0,
+    StructMeta: _struct_default_as_bits,
+    BitsetMeta: lambda meta: meta.default_u64(),
+    BufMeta: lambda meta: meta.default_value,
+    EnumMeta: lambda meta: meta.default_value_idx if meta.default_value else 0,
+}
 
 def parse_spec(spec_path: pathlib.Path) -> DeviceSpec:
+    """
+    Loads a device spec from its toml file, merging in the specs of its base devices.
+
+    The returned spec does not include the synthetic SETTING and SETTING_COMMAND enums; callers that resolve
+    enum:SETTING-style dtypes need to pass it through inject_setting_enums (parse_spec_to_device already does).
+    """
     if isinstance(spec_path, str):
         spec_path = pathlib.Path(spec_path)
     with open(spec_path, "rb") as f:
         dev_spec_data = tomllib.load(f)
     
     dev_spec = DeviceSpec.from_dict(dev_spec_data)
-    dev: DeviceSpec
     upper_dev: DeviceSpec = dev_spec
     for base in dev_spec.base:
         with open(spec_path.parent/f"{base.lower()}.toml", "rb") as f:
@@ -301,7 +354,14 @@ def parse_spec(spec_path: pathlib.Path) -> DeviceSpec:
         base_spec.setting_commands.update(upper_dev.setting_commands)
         base_spec.vendordep = upper_dev.vendordep
         upper_dev = base_spec
-    dev = upper_dev
+    return upper_dev
+
+def inject_setting_enums(dev: DeviceSpec) -> DeviceSpec:
+    """
+    Adds the synthetic SETTING and SETTING_COMMAND enums, built from the device's settings and setting commands.
+
+    parse_spec doesn't do this itself, as only consumers that resolve enum:SETTING-style dtypes need them.
+    """
     dev.enums['SETTING'] = EnumSpec.from_dict({
         "btype": "uint",
         "bits": 8,
@@ -321,4 +381,4 @@ def parse_spec(spec_path: pathlib.Path) -> DeviceSpec:
 
 def parse_spec_to_device(spec_path: pathlib.Path) -> Device:
     from .model_impl import impl_Device_from
-    return impl_Device_from(parse_spec(spec_path))
\ No newline at end of file
+    return impl_Device_from(inject_setting_enums(parse_spec(spec_path)))
\ No newline at end of file
@@ -2,6 +2,7 @@ from . import *
 from . import toml_defs
 from .utils import *
 from typing import *
+import weakref
 
 def impl_DType_from_type(type_name: str, type_def: toml_defs.TypeSpec, default_value: Any, dev: toml_defs.DeviceSpec):
     if default_value is None:
@@ -52,7 +53,23 @@ def impl_DType_from_type(type_name: str, type_def: toml_defs.TypeSpec, default_v
             return impl_DType_from_type(type_def.btype, dev.types[type_def.btype], default_value, dev)
             pass
 
+# DTypes are never mutated after construction, so signals sharing a (dtype, default) pair can share one.
+# The type of the default is part of the key so e.g. True and 1 don't alias each other.
+_dtype_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 def impl_DType_from_sig(dev: toml_defs.DeviceSpec, dtype_name: str, default_value: Any) -> DType:
+    dev_cache = _dtype_cache.setdefault(dev, {})
+    key = (dtype_name, type(default_value), default_value)
+    try:
+        if key in dev_cache:
+            return dev_cache[key]
+    except TypeError:
+        # unhashable default value; don't bother caching it
+        return _impl_DType_from_sig(dev, dtype_name, default_value)
+    dtype = dev_cache[key] = _impl_DType_from_sig(dev, dtype_name, default_value)
+    return dtype
+
+def _impl_DType_from_sig(dev: toml_defs.DeviceSpec, dtype_name: str, default_value: Any) -> DType:
     nsplit = dtype_name.split(":")
     match nsplit[0]:
         case "none":
@@ -146,7 +163,6 @@ def impl_Message_from(dm: toml_defs.DeviceMessageSpec, dev: toml_defs.DeviceSpec
 
 def impl_Setting_from(name: str, value: toml_defs.DeviceSettingSpec, dev: toml_defs.DeviceSpec) -> Setting:
     dtype = impl_DType_from_sig(dev, value.dtype, value.default_value)
-    print(value)
 
     return Setting(
         name = name,
@@ -211,6 +227,14 @@ def impl_StructMeta_from(name: str, ent: toml_defs.TypeSpec, dev: toml_defs.Devi
                 optional = sig.optional) for sig in ent.signals])
 
 def impl_Device_from(dev_spec: toml_defs.DeviceSpec) -> Device:
+    bitsets: Dict[str, BitsetMeta] = {}
+    structs: Dict[str, StructMeta] = {}
+    for name, ent in dev_spec.types.items():
+        if ent.btype == "bitset":
+            bitsets[name] = impl_BitsetMeta_from(name, ent)
+        elif ent.btype == "struct":
+            structs[name] = impl_StructMeta_from(name, ent, dev_spec)
+
     return Device(
         name = dev_spec.name,
         arch = dev_spec.arch,
@@ -219,8 +243,8 @@ def impl_Device_from(dev_spec: toml_defs.DeviceSpec) -> Device:
         messages = { name: impl_Message_from(msg, dev_spec) for name, msg in dev_spec.msg.items() },
         settings = { name: impl_Setting_from(name, stg, dev_spec) for name, stg in dev_spec.settings.items() },
         enums = { name: impl_EnumMeta_from(name, ent, None) for name, ent in dev_spec.enums.items() },
-        bitsets = { name: impl_BitsetMeta_from(name, ent) for name, ent in dev_spec.types.items() if ent.btype == "bitset"},
-        structs = { name: impl_StructMeta_from(name, ent, dev_spec) for name, ent in dev_spec.types.items() if ent.btype == "struct"}, 
+        bitsets = bitsets,
+        structs = structs,
         java_package = f"{dev_spec.vendordep.java_package}" if dev_spec.vendordep else "",
         cpp_namespace = f"{dev_spec.vendordep.cpp_namespace}" if dev_spec.vendordep else "",
         spec = dev_spec
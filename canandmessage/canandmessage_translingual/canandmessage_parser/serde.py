@@ -1,6 +1,8 @@
 import typing
+import types
 import textwrap
 import pprint
+import functools
 NL = "\n"
 class SerdeError(Exception):
     pass
@@ -8,53 +10,111 @@ class SerdeError(Exception):
 class Anything:
     pass
 
+@functools.lru_cache(maxsize=None)
+def _hints(cls: type) -> typing.Dict[str, typing.Any]:
+    # get_type_hints re-evaluates string forward refs on every call, so only do it once per class.
+    # this is first called after toml_defs has finished importing, so all the forward refs resolve.
+    return typing.get_type_hints(cls)
+
+# field kinds, decided once per class by _compile_schema
+SCALAR = 0
+SERDE = 1
+LIST_PLAIN = 2
+LIST_SERDE = 3
+DICT_PLAIN = 4
+DICT_SERDE = 5
+ANYTHING = 6
+
+# what to do when a field is missing from the data: fill None, call the default factory, or raise
+_MISSING_NONE = object()
+_MISSING_REQUIRED = object()
+
+def _is_serde(t) -> bool:
+    # annotations can be generic aliases or unions, which issubclass refuses
+    return isinstance(t, type) and issubclass(t, Serde)
+
 class Serde:
+    # not annotated, otherwise get_type_hints would report it as a field
+    _serde_schema = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # forward refs in the annotations may not exist yet, so the schema is compiled on first use
+        cls._serde_schema = None
+
+    @classmethod
+    def _compile_schema(cls) -> list:
+        schema = []
+        for field, ftype in _hints(cls).items():
+            origin, args = typing.get_origin(ftype), typing.get_args(ftype)
+            # Optional[X] has origin typing.Union, PEP 604 'X | None' has origin types.UnionType
+            optional = origin in (typing.Union, types.UnionType) and type(None) in args
+            if optional:
+                ftype = next(a for a in args if a is not type(None))
+                origin, args = typing.get_origin(ftype), typing.get_args(ftype)
+
+            if optional or ftype == Anything:
+                missing = _MISSING_NONE
+            elif hasattr(cls, field):
+                missing = getattr(cls, field)
+            else:
+                missing = _MISSING_REQUIRED
+
+            if ftype == Anything:
+                kind, inner = ANYTHING, None
+            elif origin is list:
+                inner = args[0]
+                kind = LIST_SERDE if _is_serde(inner) else LIST_PLAIN
+            elif origin is dict:
+                inner = args[:2]
+                kind = DICT_SERDE if _is_serde(inner[1]) else DICT_PLAIN
+            elif _is_serde(ftype):
+                kind, inner = SERDE, ftype
+            else:
+                kind, inner = SCALAR, ftype
+            schema.append((field, kind, inner, missing))
+        cls._serde_schema = schema
+        return schema
+
     @classmethod
     def from_dict(cls, data: dict) -> typing.Self:
-        egg = cls()
-        for field, ftype in typing.get_type_hints(cls).items():
+        values = {}
+        for field, kind, inner, missing in cls._serde_schema or cls._compile_schema():
             # 1. check if the field exists in the data.
             if field not in data:
                 # if not, we have to either check for Option or a default value.
-                if str(ftype).startswith("typing.Optional") or ftype == Anything:
-                    setattr(egg, field, None)
-                elif hasattr(cls, field):
-                    # instantiate the default value if exists otherwise
-                    setattr(egg, field, getattr(cls, field)())
-                else:
+                if missing is _MISSING_NONE:
+                    values[field] = None
+                elif missing is _MISSING_REQUIRED:
                     print(data)
                     raise SerdeError(f"no attribute {field} found for {cls.__name__}")
+                else:
+                    # instantiate the default value if exists otherwise
+                    values[field] = missing()
                 continue
             # 2. we now know the value exists
-            # if the ftype is optional we have to unwrap that.
-            if str(ftype).startswith("typing.Optional"):
-                ftype = ftype.__args__[0]
-
-            if ftype == Anything:
-                # anything goes
-                setattr(egg, field, data[field])
-                continue
-            if str(ftype).startswith("typing.List"):
-                itype = ftype.__args__[0]
-                if issubclass(itype, Serde):
-                    setattr(egg, field, [itype.from_dict(v) for v in list(data[field])])
-                else:
-                    setattr(egg, field, list(data[field]))
-            elif str(ftype).startswith("typing.Dict"):
-                ktype, itype = ftype.__args__[:2]
-                if issubclass(itype, Serde):
-                    setattr(egg, field, {ktype(k): itype.from_dict(v) for k, v in data[field].items()})
-                else:
-                    setattr(egg, field, dict(data[field]))
-            elif issubclass(ftype, Serde):
-                setattr(egg, field, ftype.from_dict(data[field]))
+            value = data[field]
+            if kind == SCALAR:
+                values[field] = inner(value)
+            elif kind == SERDE:
+                values[field] = inner.from_dict(value)
+            elif kind == ANYTHING or kind == LIST_PLAIN or kind == DICT_PLAIN:
+                # anything goes. plain lists/dicts are taken as-is too: the toml loader
+                # (and the literals in inject_setting_enums) hand us fresh containers, so copying is wasted work.
+                values[field] = value
+            elif kind == LIST_SERDE:
+                values[field] = [inner.from_dict(v) for v in value]
             else:
-                setattr(egg, field, ftype(data[field]))
+                ktype, itype = inner
+                values[field] = {ktype(k): itype.from_dict(v) for k, v in value.items()}
 
+        # no Serde class defines __init__ or __slots__, so skip both and fill the instance dict directly
+        egg = object.__new__(cls)
+        egg.__dict__.update(values)
         return egg
         
     def __repr__(self) -> str:
         return f"""{self.__class__.__name__} {{
 {textwrap.indent(("," + NL).join(f"{name}: {pprint.pformat(getattr(self, name))}" 
-                                 for name in typing.get_type_hints(self.__class__).keys()), "    ")}
+                                 for name, *_ in self._serde_schema or self._compile_schema()), "    ")}
 }}"""
\ No newline at end of file
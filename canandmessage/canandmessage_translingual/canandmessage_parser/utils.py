@@ -1,4 +1,6 @@
 import typing
+import functools
+import sys
 
 def none_map(v, f):
     if v is None:
@@ -31,13 +33,24 @@ def read_suffix_as_usize(s: str) -> int:
         panic("hey dumbass you forgot the bit length in \"{s}\"")
     return int(parts[1])
 
+_UINT_MAX = [(1 << width) - 1 for width in range(65)]
+
 def default_uint_max(width: int) -> int:
+    if 0 <= width <= 64:
+        return _UINT_MAX[width]
     return (1 << width) - 1
 
+_SINT_MIN = [0] + [-(1 << (width - 1)) for width in range(1, 65)]
+_SINT_MAX = [0] + [(1 << (width - 1)) - 1 for width in range(1, 65)]
+
 def default_sint_min(width: int) -> int:
+    if 1 <= width <= 64:
+        return _SINT_MIN[width]
     return -(1 << (width - 1))
 
 def default_sint_max(width: int) -> int:
+    if 1 <= width <= 64:
+        return _SINT_MAX[width]
     return (1 << (width - 1))-1
 
 def decode_bounds_f64(min, max) -> typing.Tuple[float | None, float | None]:
@@ -55,17 +68,20 @@ def opt_value_to_opt_f64(v) -> float | None:
 def opt_value_to_opt_bool(v) -> bool | None:
     return none_map(v, bool)
 
+@functools.lru_cache(maxsize=None)
 def screaming_snake_to_kamel(s: str) -> str:
-    return "k" + "".join(c.capitalize() for c in s.split("_"))
+    return sys.intern("k" + "".join(c.capitalize() for c in s.split("_")))
 
+@functools.lru_cache(maxsize=None)
 def screaming_snake_to_camel(s: str) -> str:
-    return "".join(c.capitalize() for c in s.split("_"))
+    return sys.intern("".join(c.capitalize() for c in s.split("_")))
 
+@functools.lru_cache(maxsize=None)
 def snake_to_stilted_camel(s: str) -> str:
     v = screaming_snake_to_camel(s)
     if len(v) < 2:
-        return v.lower()
-    return v[0].lower() + v[1:]
+        return sys.intern(v.lower())
+    return sys.intern(v[0].lower() + v[1:])
 
 def rsort_by_ent_id(dct: dict):
     return sorted(dct.items(), key=lambda b: b[1].id, reverse=True)
@@ -80,6 +96,8 @@ def uwidth(width):
     else:
         return 64
 
-def padder_fn(lstr: typing.List[str]):
+def padder_fn(lstr: typing.Iterable[str]) -> typing.Tuple[typing.List[str], typing.Callable[[str], str]]:
+    # hands back the materialized names too so callers don't convert them a second time
+    lstr = list(lstr)
     v = len(max(lstr, key=len))
-    return lambda s: s.ljust(v)
\ No newline at end of file
+    return lstr, lambda s: s.ljust(v)
\ No newline at end of file
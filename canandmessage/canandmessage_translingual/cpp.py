@@ -145,7 +145,7 @@ def type_for_dtype(dtype: DType) -> str:
         case PadMeta():
             return None
         case StructMeta():
-            return "types::" + utils.screaming_snake_to_camel(dtype.meta.name)
+            return "types::" + dtype.meta.camel_name
         case _:
             return None
 
@@ -184,7 +184,7 @@ def unpack_for_dtype(dtype: DType, offset: int) -> str:
         case PadMeta():
             return None
         case StructMeta():
-            return "types::" + utils.screaming_snake_to_camel(dtype.meta.name) + f"::decode(data >> {offset})"
+            return "types::" + dtype.meta.camel_name + f"::decode(data >> {offset})"
         case _:
             return None
 
@@ -253,7 +253,7 @@ def gen_bitset(meta: BitsetMeta) -> str:
         flags.append(f"{utils.screaming_snake_to_kamel(flag.name)} = 1 << {flag.bit_idx},\n")
 
 
-    name = utils.screaming_snake_to_camel(meta.name)
+    name = meta.camel_name
     flags = indent8(njoin(flags))
 
     return f"""/** {name} bitset definition */
@@ -274,7 +274,7 @@ def gen_enum(meta: EnumMeta) -> str:
         variants.append(f"{utils.screaming_snake_to_kamel(ent.name)} = 0x{idx:x},\n")
     
     return f"""/** {meta.name} enum definition */
-class {utils.screaming_snake_to_camel(meta.name)} {{
+class {meta.camel_name} {{
   public:
     enum : {utype} {{
 {indent8(njoin(variants))}
@@ -1,6 +1,7 @@
 import typing
 import textwrap
 import html
+import functools
 from .canandmessage_parser import *
 from .canandmessage_parser import utils
 # TODO:
@@ -17,9 +18,12 @@ COPYRIGHT_NOTICE = """// Copyright (c) Redux Robotics and other contributors.
 """
 IDENT = "    "
 NL = "\n"
+# hex literal bitmasks for widths 0..64, indexed by width
+_UMASK_HEX = [f"0x{utils.default_uint_max(width):x}" for width in range(65)]
 
+@functools.lru_cache(maxsize=None)
 def doc_comment(s: str) -> str:
-    return f"/**\n{NL.join(' * ' + l for l in html.escape(s, quote=False).splitlines())}\n */"
+    return f"/**\n{NL.join([' * ' + l for l in html.escape(s, quote=False).splitlines()])}\n */"
 
 def sign_extend(expr: str, width: int) -> str:
     if width > 32:
@@ -37,20 +41,25 @@ def extract_lbits(expr: str, width: int, offset: int, signed=False) -> str:
     if width == 64:
         return expr
     if width > 31 and not (width == 32 and signed):
-        return f"{expr} & 0x{(1 << width) - 1:x}L"
+        return f"{expr} & {_UMASK_HEX[width]}L"
     if width == 32:
         return f"((int) {expr})"
-    return f"((int) {expr}) & 0x{(1 << width) - 1:x}"
+    return f"((int) {expr}) & {_UMASK_HEX[width]}"
+
+def _int_or_long(meta) -> str:
+    return "int" if meta.width <= 32 else "long"
+
+_JTYPE_FOR_META = {
+    SIntMeta: _int_or_long,
+    BitsetMeta: _int_or_long,
+    BoolMeta: lambda meta: "boolean",
+    FloatMeta: lambda meta: "float" if meta.width <= 32 else "double",
+}
 
 def get_type_for_dtype(dtype: DType):
-    meta = dtype.meta
-    if isinstance(meta, SIntMeta) or isinstance(meta, BitsetMeta):
-        return "int" if meta.width <= 32 else "long"
-    if isinstance(meta, BoolMeta):
-        return "boolean"
-    if isinstance(meta, FloatMeta):
-        return "float" if meta.width <= 32 else "double"
-    
+    jtype_fn = _JTYPE_FOR_META.get(type(dtype.meta))
+    if jtype_fn is not None:
+        return jtype_fn(dtype.meta)
     return "int" if dtype.bit_length() < 32 else "long"
 
 def rshift_to_long(expr: str, offset: int) -> str:
@@ -58,26 +67,27 @@ def rshift_to_long(expr: str, offset: int) -> str:
         return f"{expr}"
     return f"({expr} << {offset})"
 
+def _float_to_long(name: str, width: int) -> str:
+    if width == 24:
+        return f"((long) (Float.floatToIntBits({name}) >> 8) & 0xffffffL)"
+    if width == 32:
+        return f"((long) Float.floatToIntBits({name}) & 0xffffffffL)"
+    utils.panic(ValueError(f"float width {width} unsupported"))
+
+_JTYPE_TO_LONG = {
+    # so we need the bitmask to ensure no sign extension happens. because java.
+    'int': lambda name, width: f"((long) {name})" if width < 32 else f"((long) {name} & 0xffffffffL)",
+    'long': lambda name, width: f"({name} & {_UMASK_HEX[width]}L)" if width != 64 else name,
+    'boolean': lambda name, width: f"({name} ? 1L : 0L)",
+    'float': _float_to_long,
+    'double': lambda name, width: f"Double.doubleToLongBits({name})",
+}
+
 def jtype_to_long(name: str, jtype: str, offset: int, width: int) -> str:
-    mask = hex(utils.default_uint_max(width))
-    match jtype:
-        case 'int':
-            # so we need the bitmask to ensure no sign extension happens. because java.
-            return rshift_to_long(f"((long) {name})" if width < 32 
-                                  else f"((long) {name} & 0xffffffffL)", offset)
-        case 'long':
-            return rshift_to_long(f"({name} & {mask}L)" if width != 64 else name, offset)
-        case 'boolean':
-            return rshift_to_long(f"({name} ? 1L : 0L)", offset)
-        case 'float':
-            if width == 24:
-                return rshift_to_long(f"((long) (Float.floatToIntBits({name}) >> 8) & 0xffffffL)", offset)
-            if width == 32:
-                return rshift_to_long(f"((long) Float.floatToIntBits({name}) & 0xffffffffL)", offset)
-            else:
-                utils.panic(ValueError(f"float width {width} unsupported"))
-        case 'double':
-            return rshift_to_long(f"Double.doubleToLongBits({name})", offset)
+    to_long = _JTYPE_TO_LONG.get(jtype)
+    if to_long is None:
+        return None
+    return rshift_to_long(to_long(name, width), offset)
 
 
 
@@ -87,94 +97,122 @@ def gen_cls(name: str, members: typing.List[str], doc: str, visibility="public",
         members = [f"private {name}() {{}}"] + list(members)
 
     return f"""{doc_comment(doc)}
-{' '.join(c for c in [visibility, modifier, ctype] if c)} {name} {{
-{DELIM.join(textwrap.indent(m, IDENT) for m in members)}
+{' '.join([c for c in [visibility, modifier, ctype] if c])} {name} {{
+{textwrap.indent(DELIM.join(members), IDENT)}
 }}"""
 
 def gen_sig_extract(sig: Signal, prefix="", offset=0, apply_prefix=True) -> typing.Tuple[typing.List[str], int]:
     # extractMessageName_SigName_SubsigName(long field) -> [value]
+    extract_value, offset = _sig_extract(sig.name, sig.comment, sig.dtype, prefix, offset, apply_prefix)
+    return list(extract_value), offset
+
+def _extract_uint(meta, offset: int) -> str:
+    return f"return {extract_lbits('field', meta.width, offset)};"
+
+def _extract_bitset(meta, offset: int) -> str:
+    return f"return {extract_lbits('field', meta.width, offset, True)};"
+
+def _extract_sint(meta, offset: int) -> str:
+    return f"return {sign_extend(extract_lbits('field', meta.width, offset, True), meta.width)};"
+
+def _extract_float(meta, offset: int) -> typing.Optional[str]:
+    match meta.width:
+        case 24:
+            return f"return Float.intBitsToFloat(({extract_lbits('field', 24, offset)}) << 8);"
+        case 32:
+            return f"return Float.intBitsToFloat({extract_lbits('field', 32, offset, True)});"
+        case 64:
+            return f"return Double.longBitsToDouble(field >> {offset});"
+    return None
+
+def _extract_bool(meta, offset: int) -> str:
+    return f"return ((field >> {offset}) & 1) > 0;"
+
+# leaf meta type -> extract body builder; bools are 1 bit wide, everything else advances by meta.width
+_EXTRACT_DISPATCH = {
+    UIntMeta: _extract_uint,
+    EnumMeta: _extract_uint,
+    BufMeta: _extract_uint,
+    BitsetMeta: _extract_bitset,
+    SIntMeta: _extract_sint,
+    FloatMeta: _extract_float,
+    BoolMeta: _extract_bool,
+}
+
+# the generated source only depends on these fields, and parsed dtypes are shared between identical signatures,
+# so struct types reused across messages are only rendered once per offset.
+@functools.lru_cache(maxsize=None)
+def _sig_extract(sig_name: str, sig_comment: str, dtype: DType, prefix: str, offset: int, 
+                 apply_prefix: bool) -> typing.Tuple[typing.Tuple[str, ...], int]:
     extract_value = ""
-    meta = sig.dtype.meta
+    meta = dtype.meta
     is_pad_or_none = meta is None
-    name = utils.screaming_snake_to_camel(sig.name)
-    match meta:
-        case UIntMeta() | EnumMeta() | BufMeta():
-            extract_value = f"return {extract_lbits('field', meta.width, offset)};"
-            offset += meta.width
-        case BitsetMeta():
-            extract_value = f"return {extract_lbits('field', meta.width, offset, True)};"
-            offset += meta.width
-        case SIntMeta():
-            extract_value = f"return {sign_extend(extract_lbits('field', meta.width, offset, True), meta.width)};"
-            offset += meta.width
-        case FloatMeta():
-            match meta.width:
-                case 24:
-                    extract_value = f"return Float.intBitsToFloat(({extract_lbits('field', 24, offset)}) << 8);"
-                case 32:
-                    extract_value = f"return Float.intBitsToFloat({extract_lbits('field', 32, offset, True)});"
-                case 64:
-                    extract_value = f"return Double.longBitsToDouble(field >> {offset});"
-                case _:
-                    utils.panic(ValueError(f"float width {meta.width} unsuppoerted in sig {sig.name}"))
-            offset += meta.width
-        case BoolMeta():
-            extract_value = f"return ((field >> {offset}) & 1) > 0;"
-            offset += 1
-        case PadMeta():
-            is_pad_or_none = True
-            offset += meta.width
-        case StructMeta():
-            prefix = f"{prefix if apply_prefix else ''}{name}_"
-            extract_value = []
-            for subsig in meta.signals:
-                v, offset = gen_sig_extract(subsig, prefix, offset)
-                extract_value.extend(v)
-        case _:
-            is_pad_or_none = True
+    name = utils.screaming_snake_to_camel(sig_name)
+    extract_fn = _EXTRACT_DISPATCH.get(type(meta))
+    if extract_fn is not None:
+        extract_value = extract_fn(meta, offset)
+        if extract_value is None:
+            utils.panic(ValueError(f"float width {meta.width} unsuppoerted in sig {sig_name}"))
+        offset += 1 if type(meta) is BoolMeta else meta.width
+    elif isinstance(meta, PadMeta):
+        is_pad_or_none = True
+        offset += meta.width
+    elif isinstance(meta, StructMeta):
+        prefix = f"{prefix if apply_prefix else ''}{name}_"
+        extract_value = []
+        for subsig in meta.signals:
+            v, offset = _sig_extract(subsig.name, subsig.comment, subsig.dtype, prefix, offset, True)
+            extract_value.extend(v)
+    else:
+        is_pad_or_none = True
     if is_pad_or_none:
-        return [], offset
+        return (), offset
     if isinstance(extract_value, str):
-        doc = doc_comment(f"Extracts {sig.comment} from {prefix.strip('_')}.\n\n"
+        doc = doc_comment(f"Extracts {sig_comment} from {prefix.strip('_')}.\n\n"
                         f"@param field data bitfield\n"
-                        f"@return {sig.name} as a {sig.dtype.canonical_name()}")
-        return [f"""{doc}
-public static {get_type_for_dtype(sig.dtype)} extract{prefix if apply_prefix else ''}{name}(long field) {{
+                        f"@return {sig_name} as a {dtype.canonical_name()}")
+        return (f"""{doc}
+public static {get_type_for_dtype(dtype)} extract{prefix if apply_prefix else ''}{name}(long field) {{
 {textwrap.indent(extract_value, IDENT)}
-}}"""], offset
+}}""",), offset
     else:
-        return extract_value, offset
+        return tuple(extract_value), offset
 
 def gen_check(expr: str, err_msg: str):
     return f"if ({expr}) {{ throw new IllegalArgumentException({err_msg}); }}"
 
+def _bounds_check(sig_name: str, lo, hi, l_is_real: str) -> str:
+    return gen_check(f"{sig_name} < {lo}{l_is_real} || {sig_name} > {hi}{l_is_real}", 
+                     f'"{sig_name} must be between [{lo}..={hi}] inclusive, instead got " + {sig_name}')
+
 def gen_sig_checks(sig: Signal) -> typing.List[str]:
-    meta = sig.dtype.meta
-    sig_name = utils.snake_to_stilted_camel(sig.name)
-    jtype = get_type_for_dtype(sig.dtype)
+    return list(_sig_checks(sig.name, sig.dtype))
+
+@functools.lru_cache(maxsize=None)
+def _sig_checks(name: str, dtype: DType) -> typing.Tuple[str, ...]:
+    meta = dtype.meta
+    sig_name = utils.snake_to_stilted_camel(name)
+    jtype = get_type_for_dtype(dtype)
     l_is_real = "L" if jtype == "long" else ""
     match meta:
         case UIntMeta():
             if meta.width == 64:
                 return [] # attempting to bounds-check a 64-bit uint in this godforsaken signed-only lang will end Poorly.
             # min and max are well-defined for the inputs
-            return [gen_check(f"{sig_name} < {meta.min}{l_is_real} || {sig_name} > {meta.max}{l_is_real}", 
-                              f'"{sig_name} must be between [{meta.min}..={meta.max}] inclusive, instead got " + {sig_name}')]
+            return (_bounds_check(sig_name, meta.min, meta.max, l_is_real),)
         case SIntMeta():
             if ((meta.width == 32 or meta.width == 64) and 
                 meta.min == utils.default_sint_min(meta.width) and 
                 meta.max == utils.default_sint_max(meta.width)):
                 return [] # special case the precise instance where field width equals listed min/max
-            return [gen_check(f"{sig_name} < {meta.min}{l_is_real} || {sig_name} > {meta.max}{l_is_real}", 
-                              f'"{sig_name} must be between [{meta.min}..={meta.max}] inclusive, instead got " + {sig_name}')]
+            return (_bounds_check(sig_name, meta.min, meta.max, l_is_real),)
         case BufMeta() | BitsetMeta():
             if meta.width == 64 and jtype == "long" or meta.width == 32 and jtype == "int":
                 # bounds check don't work at signed type boundary conditions
                 return []
             # check that the value is within 0..uint_max(sig.dtype.bit_length())
-            umax = utils.default_uint_max(sig.dtype.bit_length())
-            return [gen_check(f"{sig_name} < 0{l_is_real} || {sig_name} > {umax}{l_is_real}", 
-                              f'"{sig_name} must be between [0..={umax}] inclusive, instead got " + {sig_name}')]
+            umax = utils.default_uint_max(dtype.bit_length())
+            return (_bounds_check(sig_name, 0, umax, l_is_real),)
         case FloatMeta():
             # check min and max if not None, but also check nan/inf
             checks = []
@@ -204,45 +242,38 @@ def gen_sig_checks(sig: Signal) -> typing.List[str]:
             # recursive structure.
             checks = []
             for subsig in meta.signals:
-                checks.extend(gen_sig_checks(Signal(
-                    name = sig.name + "_" + subsig.name,
-                    comment = subsig.comment,
-                    dtype = subsig.dtype,
-                    optional = subsig.optional
-                )))
-            return checks
+                checks.extend(_sig_checks(name + "_" + subsig.name, subsig.dtype))
+            return tuple(checks)
         case _:
             return []
         
 
 
-def _render_sig(sig: Signal, offset: int) -> typing.Tuple[typing.List[str], typing.List[str], typing.List[str], int]:
-    if isinstance(sig.dtype.meta, PadMeta):
-        return [], [], [], offset + sig.dtype.bit_length()
-    if isinstance(sig.dtype.meta, StructMeta):
+def _render_sig(sig: Signal, offset: int) -> typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...], typing.Tuple[str, ...], int]:
+    try:
+        return _render_sig_parts(sig.name, sig.comment, sig.dtype, offset)
+    except ValueError:
+        raise ValueError(str(sig))
+
+@functools.lru_cache(maxsize=None)
+def _render_sig_parts(name: str, comment: str, dtype: DType, offset: int) -> typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...], typing.Tuple[str, ...], int]:
+    if isinstance(dtype.meta, PadMeta):
+        return (), (), (), offset + dtype.bit_length()
+    if isinstance(dtype.meta, StructMeta):
         param, arg, pack_expr = [], [], []
-        for subsig in sig.dtype.meta.signals:
-            p, a, k, offset = _render_sig(
-                Signal(
-                    name = sig.name + "_" + subsig.name,
-                    comment = subsig.comment,
-                    dtype = subsig.dtype,
-                    optional=subsig.optional,
-                ), offset)
+        for subsig in dtype.meta.signals:
+            p, a, k, offset = _render_sig_parts(name + "_" + subsig.name, subsig.comment, subsig.dtype, offset)
             param.extend(p)
             arg.extend(a)
             pack_expr.extend(k)
-        return param, arg, pack_expr, offset
+        return tuple(param), tuple(arg), tuple(pack_expr), offset
 
-    jtype = get_type_for_dtype(sig.dtype)
-    sig_name = utils.snake_to_stilted_camel(sig.name)
-    try:
-        param = f"@param {sig_name} {sig.comment} ({sig.dtype.canonical_name()})"
-    except Exception:
-        raise ValueError(str(sig))
+    jtype = get_type_for_dtype(dtype)
+    sig_name = utils.snake_to_stilted_camel(name)
+    param = f"@param {sig_name} {comment} ({dtype.canonical_name()})"
     arg = f"{jtype} {sig_name}"
-    pack_expr = jtype_to_long(sig_name, jtype, offset, sig.dtype.bit_length())
-    return ([param], [arg], [pack_expr], offset + sig.dtype.bit_length())
+    pack_expr = jtype_to_long(sig_name, jtype, offset, dtype.bit_length())
+    return ((param,), (arg,), (pack_expr,), offset + dtype.bit_length())
 
 def gen_sigs_pack(name: str, signals: typing.List[Signal], compound_type: str, check_bounds=False) -> str:
     params = []
@@ -269,7 +300,7 @@ def gen_sigs_pack(name: str, signals: typing.List[Signal], compound_type: str, c
                       "\n".join(params) + 
                       "\n@return message data as long")
     
-    pack = check_val + textwrap.indent(f'return {(" | " + NL).join(pack_exprs)};', 2*IDENT)[4:]
+    pack = check_val + f'{IDENT}return {(" | " + NL + 2*IDENT).join(pack_exprs)};'
     return f"""{doc}
 public static long construct{utils.screaming_snake_to_camel(name)}({", ".join(args)}) {{
 {pack}
@@ -279,30 +310,24 @@ public static long construct{utils.screaming_snake_to_camel(name)}({", ".join(ar
 def gen_msg(dev: Device) -> str:
     members = []
 
-    msg_pad = utils.padder_fn(map(utils.screaming_snake_to_kamel, dev.messages.keys()))
+    msg_kamels, msg_pad = utils.padder_fn(map(utils.screaming_snake_to_kamel, dev.messages.keys()))
+    msg_kamels = dict(zip(dev.messages.keys(), msg_kamels))
     msg: Message
-    for name, msg in utils.rsort_by_ent_id(dev.messages):
-        if not msg.is_public:
-            continue
+    msgs_sorted = [(name, msg) for name, msg in utils.rsort_by_ent_id(dev.messages) if msg.is_public]
+    for name, msg in msgs_sorted:
         members.append(
-            f"{doc_comment(msg.comment)}\npublic static final int {msg_pad(utils.screaming_snake_to_kamel(name))} = 0x{msg.id:x};")
+            f"{doc_comment(msg.comment)}\npublic static final int {msg_pad(msg_kamels[name])} = 0x{msg.id:x};")
     
-    for name, msg in utils.rsort_by_ent_id(dev.messages):
-        if not msg.is_public:
-            continue
+    for name, msg in msgs_sorted:
         offset = 0
         for sig in msg.signals:
             v, offset = gen_sig_extract(sig, prefix=utils.screaming_snake_to_camel(name) + "_", offset=offset)
             members.extend(v)
     
-    for name, msg in utils.rsort_by_ent_id(dev.messages):
-        if not msg.is_public:
-            continue
+    for name, msg in msgs_sorted:
         members.append(gen_sigs_pack(name, msg.signals, "message"))
     
-    for name, msg in utils.rsort_by_ent_id(dev.messages):
-        if not msg.is_public:
-            continue
+    for name, msg in msgs_sorted:
         if msg.min_length == msg.max_length:
             members.append(f"/** {name} message length */\npublic static final int kDlc_{utils.screaming_snake_to_camel(name)} = {msg.min_length};")
             members.append(f"""/**\n * Check if {name} message length is valid.\n * @param dlc length to check\n * @return true if valid\n */
@@ -330,49 +355,51 @@ def gen_vdep_stg_list(dev: Device) -> str:
     
     return f"""/** List of settings to fetch for. */
 public static int settingsAddresses[] = {{
-{'\n'.join(all_stg)}
+{NL.join(all_stg)}
 }};"""
 
 def gen_vdep_default_stg(dev: Device) -> str:
-    put_stg = []
+    entries = []
     for name, stg in dev.settings.items():
         #print(stg)
         if not (stg.vdep_setting and stg.vendordep and stg.readable):
             continue
         default_value_as_bits = stg.dtype.default_value_as_bits()
         if isinstance(default_value_as_bits, float):
-            print("Fucked setting default value: ", stg, stg.dtype.meta)
+            # FloatMeta defaults already come back as their bit pattern, so a float here is a bad spec default
+            utils.panic(ValueError(f"setting {name} has non-integer default value {default_value_as_bits!r} for {stg.dtype.canonical_name()}"))
+        entries.append((utils.screaming_snake_to_kamel(name), default_value_as_bits))
 
-        put_stg.append(f"    stg.put({utils.screaming_snake_to_kamel(name)}, 0x{stg.dtype.default_value_as_bits():x}L);")
+    return f"""/** Default values of the readable settings, as {{address, value}} pairs. */
+private static final long[][] defaultSettingsTable = {{
+{NL.join([f"    {{{kamel}, 0x{value:x}L}}," for kamel, value in entries])}
+}};
 
-    return f"""/** Creates a HashMap of writable default settings. */
+/** Creates a HashMap of writable default settings. */
 public static Map<Integer, Long> defaultSettings; 
 static {{
     Map<Integer, Long> stg = new HashMap<>();
-{'\n'.join(put_stg)}
+    for (long[] ent : defaultSettingsTable) {{
+        stg.put((int) ent[0], ent[1]);
+    }}
     defaultSettings = stg;
 }}
 """
 
 def gen_stg(dev: Device) -> str:
     members = []
-    stg_pad = utils.padder_fn(map(utils.screaming_snake_to_kamel, dev.settings.keys()))
+    stg_kamels, stg_pad = utils.padder_fn(map(utils.screaming_snake_to_kamel, dev.settings.keys()))
+    stg_kamels = dict(zip(dev.settings.keys(), stg_kamels))
     stg: Setting
-    for name, stg in utils.rsort_by_ent_id(dev.settings):
-        if not stg.vendordep:
-            continue
-
+    stgs_sorted = [(name, stg) for name, stg in utils.rsort_by_ent_id(dev.settings) if stg.vendordep]
+    for name, stg in stgs_sorted:
         members.append(
-            f"{doc_comment(stg.comment)}\npublic static final int {stg_pad(utils.screaming_snake_to_kamel(name))} = 0x{stg.id:x};")
+            f"{doc_comment(stg.comment)}\npublic static final int {stg_pad(stg_kamels[name])} = 0x{stg.id:x};")
 
-    for name, stg in utils.rsort_by_ent_id(dev.settings):
-        if not stg.vendordep:
-            continue
+    for name, stg in stgs_sorted:
         members.extend(gen_sig_extract(Signal.from_stg(name, stg), prefix=utils.screaming_snake_to_camel(name) + "_", apply_prefix = False)[0])
 
-    for name, stg in utils.rsort_by_ent_id(dev.settings):
-        if not stg.vendordep:
-            continue
+    for name, stg in stgs_sorted:
         if isinstance(stg.dtype.meta, StructMeta):
             members.append(gen_sigs_pack(name, stg.dtype.meta.signals, "setting", True))
         else:
@@ -389,10 +416,10 @@ def gen_enumers(dev: Device) -> str:
         if name == "SETTING":
             continue
         enumer_members = []
-        enumer_pad = utils.padder_fn(map(lambda v: utils.screaming_snake_to_kamel(v.name), meta.values.values()))
-        for eindex, enumer in meta.values.items():
+        enumer_kamels, enumer_pad = utils.padder_fn(map(lambda v: utils.screaming_snake_to_kamel(v.name), meta.values.values()))
+        for enumer, kamel in zip(meta.values.values(), enumer_kamels):
             enumer_members.append(
-            f"{doc_comment(enumer.comment)}\npublic static final int {enumer_pad(utils.screaming_snake_to_kamel(enumer.name))} = 0x{enumer.index:x};")
+            f"{doc_comment(enumer.comment)}\npublic static final int {enumer_pad(kamel)} = 0x{enumer.index:x};")
             pass
         members.append(gen_cls(utils.screaming_snake_to_camel(name), enumer_members, f"enum {dev.name}::{name}.", modifier="static", uninstantiable=True))
     
@@ -406,20 +433,20 @@ def gen_bitsets(dev: Device) -> str:
         for ent in meta.flags:
             members.append(doc_comment(f"{name} - {ent.comment}") + 
                            f"\npublic static final {jtype} {utils.screaming_snake_to_kamel(name)}_"
-                           f"{utils.screaming_snake_to_camel(ent.name)} = {hex(1 << ent.bit_idx)};")
+                           f"{utils.screaming_snake_to_camel(ent.name)} = {hex(ent.mask)};")
 
     for name, meta in dev.bitsets.items():
         jtype = "int" if meta.width <= 32 else "long"
         doc_params = [f"@param {utils.snake_to_stilted_camel(ent.name)} {ent.comment.strip()}" for ent in meta.flags]
         arg_params = [f"boolean {utils.snake_to_stilted_camel(ent.name)}" for ent in meta.flags]
         lfix = 'L' if jtype == 'long' else ''
-        pack_exprs = [f"({utils.snake_to_stilted_camel(ent.name)} ? {hex(1 << ent.bit_idx)}{lfix} : 0)" for ent in meta.flags] or ["0"]
+        pack_exprs = [f"({utils.snake_to_stilted_camel(ent.name)} ? {hex(ent.mask)}{lfix} : 0)" for ent in meta.flags] or ["0"]
 
         doc = doc_comment(f"Constructs a {name} bitset.\n\n" + 
                         "\n".join(doc_params) + 
                         f"\n@return bitset data as {jtype}")
     
-        pack = textwrap.indent(f'return {(" | " + NL).join(pack_exprs)};', 2*IDENT)[4:]
+        pack = f'{IDENT}return {(" | " + NL + 2*IDENT).join(pack_exprs)};'
         members.append(f"{doc}\n"
         f"public static {jtype} construct{utils.screaming_snake_to_camel(name)}({', '.join(arg_params)}) {{\n"
         f"{pack}\n}}")
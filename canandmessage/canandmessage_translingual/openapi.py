@@ -4,79 +4,154 @@ from enum import Enum
 import json
 import yaml
 import os
+import sys
+import functools
+import weakref
+
+try:
+    # libyaml's emitter, when pyyaml was built with it
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class _SpecDumper(_YamlDumper):
+    # the spec shares constant sub-objects between endpoints; write them out in full rather than as &id anchors
+    def ignore_aliases(self, data):
+        return True
 
 from canandmessage_translingual.canandmessage_parser.model_impl import impl_DType_from_sig, impl_DType_from_type
 from .canandmessage_parser import *
 from .canandmessage_parser import toml_defs
+from .canandmessage_parser import utils
 from .canandmessage_parser import DTypeOnion
 
+# per-device {dtype: schema} memo; custom types resolve against dev.types, so entries can't be shared across devices.
+_dtype_schema_cache: "weakref.WeakKeyDictionary[toml_defs.DeviceSpec, Dict[str, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
 def format_dtype_for_openapi(dtype: str, dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
     """Convert dtype to OpenAPI schema format"""
-    if dtype.startswith("enum:"):
-        return {
-            "type": "string",
-            "enum": [f"ENUM_{dtype[5:].upper()}"],
-            "description": f"Enum type: {dtype[5:]}"
-        }
-    elif dtype.startswith("sint:"):
-        bits = int(dtype[5:])
-        return {
-            "type": "integer",
-            "format": f"int{bits}",
-            "minimum": -(2**(bits-1)),
-            "maximum": 2**(bits-1) - 1,
-            "description": f"Signed {bits}-bit integer"
-        }
-    elif dtype.startswith("uint:"):
-        bits = int(dtype[5:])
+    return _copy_schema(_cached_dtype_schema(dtype, dev))
+
+def _copy_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached schema, including its nested items/enum containers, so callers can't modify the cached one"""
+    return {k: v.copy() if isinstance(v, (dict, list)) else v for k, v in schema.items()}
+
+def _dtype_schemas_for(dev: toml_defs.DeviceSpec) -> Dict[str, Dict[str, Any]]:
+    """The device's {dtype: schema} memo, created on first use"""
+    dev_cache = _dtype_schema_cache.get(dev)
+    if dev_cache is None:
+        dev_cache = _dtype_schema_cache[dev] = {}
+    return dev_cache
+
+def _cached_dtype_schema(dtype: str, dev: toml_defs.DeviceSpec, dev_cache: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Shared, memoized schema for dtype; callers must copy before modifying it"""
+    if dev_cache is None:
+        dev_cache = _dtype_schemas_for(dev)
+    schema = dev_cache.get(dtype)
+    if schema is None:
+        schema = dev_cache[dtype] = _format_dtype_for_openapi(dtype, dev)
+    return schema
+
+# the same handful of widths show up in every device, so share one string per width instead of formatting per dtype
+_SIGNED_DESC = {bits: sys.intern(f"Signed {bits}-bit integer") for bits in range(1, 65)}
+_UNSIGNED_DESC = {bits: sys.intern(f"Unsigned {bits}-bit integer") for bits in range(1, 65)}
+
+@functools.lru_cache(maxsize=None)
+def _int_format(prefix: str, bits: int) -> str:
+    return sys.intern(f"{prefix}{bits}")
+
+def _fmt_enum(arg: str) -> Dict[str, Any]:
+    return {
+        "type": "string",
+        "enum": [f"ENUM_{arg.upper()}"],
+        "description": f"Enum type: {arg}"
+    }
+
+def _fmt_sint(arg: str) -> Dict[str, Any]:
+    bits = int(arg)
+    return {
+        "type": "integer",
+        "format": _int_format("int", bits),
+        "minimum": utils.default_sint_min(bits),
+        "maximum": utils.default_sint_max(bits),
+        "description": _SIGNED_DESC.get(bits) or f"Signed {bits}-bit integer"
+    }
+
+def _fmt_uint(arg: str) -> Dict[str, Any]:
+    bits = int(arg)
+    return {
+        "type": "integer",
+        "format": _int_format("uint", bits),
+        "minimum": 0,
+        "maximum": utils.default_uint_max(bits),
+        "description": _UNSIGNED_DESC.get(bits) or f"Unsigned {bits}-bit integer"
+    }
+
+def _fmt_buf(arg: str) -> Dict[str, Any]:
+    # round partial bytes up
+    n_bytes = (int(arg) + 7) >> 3
+    return {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 0, "maximum": 255},
+        "minItems": n_bytes,
+        "maxItems": n_bytes,
+        "description": f"Byte array of {n_bytes} bytes"
+    }
+
+def _fmt_pad(arg: str) -> Dict[str, Any]:
+    return {
+        "type": "integer",
+        "minimum": 0,
+        "maximum": 0,
+        "description": f"Padding field ({arg} bits)"
+    }
+
+def _fmt_float(arg: str) -> Dict[str, Any]:
+    width = arg[-2:]
+    if width == "24":
         return {
-            "type": "integer",
-            "format": f"uint{bits}",
-            "minimum": 0,
-            "maximum": 2**bits - 1,
-            "description": f"Unsigned {bits}-bit integer"
+            "type": "number",
+            "format": "float",
+            "description": "24-bit float"
         }
-    elif dtype.startswith("buf:"):
-        n_bytes = (int(dtype[4:]) + 1) // 8
+    elif width == "32":
         return {
-            "type": "array",
-            "items": {"type": "integer", "minimum": 0, "maximum": 255},
-            "minItems": n_bytes,
-            "maxItems": n_bytes,
-            "description": f"Byte array of {n_bytes} bytes"
+            "type": "number",
+            "format": "float",
+            "description": "32-bit float"
         }
-    elif dtype.startswith("pad:"):
+    else:
         return {
-            "type": "integer",
-            "minimum": 0,
-            "maximum": 0,
-            "description": f"Padding field ({dtype[4:]} bits)"
+            "type": "number",
+            "format": "double",
+            "description": "64-bit double"
         }
+
+# "<prefix>:<arg>" dtypes, dispatched on the prefix
+_PREFIX_HANDLERS = {
+    "enum": _fmt_enum,
+    "sint": _fmt_sint,
+    "uint": _fmt_uint,
+    "buf": _fmt_buf,
+    "pad": _fmt_pad,
+    "float": _fmt_float,
+}
+
+def _format_dtype_for_openapi(dtype: str, dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
+    head, sep, arg = dtype.partition(":")
+    handler = _PREFIX_HANDLERS.get(head) if sep else None
+    if handler is not None:
+        return handler(arg)
     elif dtype == "bool" or dtype == "bit":
         return {
             "type": "boolean",
             "description": "Boolean value"
         }
-    elif dtype.startswith("float:"):
-        width = dtype[-2:]
-        if width == "24":
-            return {
-                "type": "number",
-                "format": "float",
-                "description": "24-bit float"
-            }
-        elif width == "32":
-            return {
-                "type": "number",
-                "format": "float",
-                "description": "32-bit float"
-            }
-        else:
-            return {
-                "type": "number",
-                "format": "double",
-                "description": "64-bit double"
-            }
     else:
         # Check if it's a custom type defined in the device specification
         if dtype in dev.types:
@@ -85,17 +160,17 @@ def format_dtype_for_openapi(dtype: str, dev: toml_defs.DeviceSpec) -> Dict[str,
             if type_spec.btype == "sint":
                 return {
                     "type": "integer",
-                    "format": f"int{type_spec.bits}",
-                    "minimum": -(2**(type_spec.bits-1)),
-                    "maximum": 2**(type_spec.bits-1) - 1,
+                    "format": _int_format("int", type_spec.bits),
+                    "minimum": utils.default_sint_min(type_spec.bits),
+                    "maximum": utils.default_sint_max(type_spec.bits),
                     "description": type_spec.comment
                 }
             elif type_spec.btype == "uint":
                 return {
                     "type": "integer",
-                    "format": f"uint{type_spec.bits}",
+                    "format": _int_format("uint", type_spec.bits),
                     "minimum": 0,
-                    "maximum": 2**type_spec.bits - 1,
+                    "maximum": utils.default_uint_max(type_spec.bits),
                     "description": type_spec.comment
                 }
             elif type_spec.btype == "float":
@@ -107,9 +182,9 @@ def format_dtype_for_openapi(dtype: str, dev: toml_defs.DeviceSpec) -> Dict[str,
             elif type_spec.btype == "bitset":
                 return {
                     "type": "integer",
-                    "format": f"uint{type_spec.bits}",
+                    "format": _int_format("uint", type_spec.bits),
                     "minimum": 0,
-                    "maximum": 2**type_spec.bits - 1,
+                    "maximum": utils.default_uint_max(type_spec.bits),
                     "description": type_spec.comment
                 }
             else:
@@ -126,16 +201,17 @@ def format_dtype_for_openapi(dtype: str, dev: toml_defs.DeviceSpec) -> Dict[str,
 def generate_message_schema(msg: toml_defs.DeviceMessageSpec, dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
     """Generate OpenAPI schema for a message"""
     properties = {}
-    required = []
+    required = [signal.name for signal in msg.signals if not signal.optional]
+    # look the device's memo up once per message rather than once per signal
+    dev_cache = _dtype_schemas_for(dev)
+    cache_get = dev_cache.get
     
     for signal in msg.signals:
-        if not signal.optional:
-            required.append(signal.name)
-        
-        properties[signal.name] = {
-            **format_dtype_for_openapi(signal.dtype, dev),
-            "description": signal.comment
-        }
+        name, dtype = signal.name, signal.dtype
+        # only the top level gets a new key; the nested containers are shared read-only with the cached schema
+        props = (cache_get(dtype) or _cached_dtype_schema(dtype, dev, dev_cache)).copy()
+        props["description"] = signal.comment
+        properties[name] = props
     
     return {
         "type": "object",
@@ -144,403 +220,371 @@ def generate_message_schema(msg: toml_defs.DeviceMessageSpec, dev: toml_defs.Dev
         "description": msg.comment
     }
 
-def generate_openapi_spec(dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
-    """Generate complete OpenAPI specification for a device"""
-    
-    # Get device messages that are public and from device to host
-    device_messages = [
-        (name, msg) for name, msg in dev.msg.items() 
-        if msg.is_public and msg.source in ["device", "both"]
-    ]
-    
-    # Generate message schemas
-    message_schemas = {}
-    message_endpoints = {}
-    
-    for name, msg in device_messages:
-        schema_name = f"{name}Message"
-        message_schemas[schema_name] = generate_message_schema(msg, dev)
-        
-        # Convert message name to camelCase for endpoint
-        camel_name = ''.join(word.capitalize() for word in name.split('_'))
-        
-        # Create endpoint for this message
-        endpoint_path = f"/{dev.name.lower()}/{{bus_id}}/{{session_id}}/{camel_name}"
-        message_endpoints[endpoint_path] = {
-            "get": {
-                "summary": f"Get {name} message",
-                "description": msg.comment,
-                "parameters": [
-                    {
-                        "name": "bus_id",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                        "description": "CAN bus ID (hexadecimal)"
-                    },
-                    {
-                        "name": "session_id", 
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                        "description": "Session ID (hexadecimal)"
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Success",
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": f"#/components/schemas/{schema_name}"}
-                            }
+# device-independent parts of the spec, built once at import. generate_openapi_spec shallow-copies
+# the containers it adds to and shares everything else, so nothing here should be mutated.
+_SERVERS = [
+    {
+        "url": "http://localhost:7244",
+        "description": "Development server"
+    }
+]
+
+# shared components the static paths $ref instead of repeating inline
+_STATIC_PARAMETERS = {
+    "BusId": {
+        "name": "bus_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+        "description": "Bus ID (hexadecimal)"
+    },
+    "SessionId": {
+        "name": "session_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+        "description": "Session ID (hexadecimal)"
+    },
+    "DeviceId": {
+        "name": "device_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+        "description": "Device ID (hexadecimal)"
+    },
+    "ArbitrationHeader": {
+        "name": "X-Arbitration",
+        "in": "header",
+        "required": False,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}$"},
+        "description": "Device arbitration ID (6-byte array in format XX-XX-XX-XX-XX-XX)"
+    }
+}
+
+_STATIC_SCHEMAS = {
+    "SixByteSerial": {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 0, "maximum": 255},
+        "minItems": 6,
+        "maxItems": 6,
+        "description": "6-byte serial number"
+    }
+}
+
+_STATIC_PATHS = {
+    "/": {
+        "get": {
+            "summary": "Root/Banner",
+            "description": "Returns HTML banner with service info and version",
+            "responses": {
+                "200": {
+                    "description": "HTML banner",
+                    "content": {
+                        "text/html": {
+                            "schema": {"type": "string"}
                         }
-                    },
-                    "404": {
-                        "description": "Not found"
                     }
                 }
             }
         }
-    
-    # Base OpenAPI specification
-    openapi_spec = {
-        "openapi": "3.0.3",
-        "info": {
-            "title": f"{dev.name} CAN API",
-            "description": f"REST API for {dev.name} CAN device communication",
-            "version": "1.0.0"
-        },
-        "servers": [
-            {
-                "url": "http://localhost:7244",
-                "description": "Development server"
-            }
-        ],
-        "paths": {
-            "/": {
-                "get": {
-                    "summary": "Root/Banner",
-                    "description": "Returns HTML banner with service info and version",
-                    "responses": {
-                        "200": {
-                            "description": "HTML banner",
-                            "content": {
-                                "text/html": {
-                                    "schema": {"type": "string"}
+    },
+    "/version": {
+        "get": {
+            "summary": "Version Info",
+            "description": "Returns current package version string",
+            "responses": {
+                "200": {
+                    "description": "Version string",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "version": {"type": "string"}
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/version": {
-                "get": {
-                    "summary": "Version Info",
-                    "description": "Returns current package version string",
-                    "responses": {
-                        "200": {
-                            "description": "Version string",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "version": {"type": "string"}
-                                        }
-                                    }
+            }
+        }
+    },
+    "/buses/open": {
+        "post": {
+            "summary": "Open Bus",
+            "description": "Opens a CAN bus connection",
+            "parameters": [
+                {
+                    "name": "params",
+                    "in": "query",
+                    "required": True,
+                    "schema": {"type": "string"},
+                    "description": "Bus parameters/name"
+                }
+            ],
+            "responses": {
+                "200": {
+                    "description": "Bus opened successfully",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {"type": "integer"},
+                                    "params": {"type": "string"}
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/buses/open": {
-                "post": {
-                    "summary": "Open Bus",
-                    "description": "Opens a CAN bus connection",
-                    "parameters": [
-                        {
-                            "name": "params",
-                            "in": "query",
-                            "required": True,
-                            "schema": {"type": "string"},
-                            "description": "Bus parameters/name"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Bus opened successfully",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "id": {"type": "integer"},
-                                            "params": {"type": "string"}
-                                        }
-                                    }
+            }
+        }
+    },
+    "/sessions/open/{bus_id}/{filter_id}/{filter_mask}": {
+        "post": {
+            "summary": "Open Session",
+            "description": "Creates a CAN session with filtering",
+            "parameters": [
+                {"$ref": "#/components/parameters/BusId"},
+                {
+                    "name": "filter_id",
+                    "in": "path", 
+                    "required": True,
+                    "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+                    "description": "Filter ID (hexadecimal)"
+                },
+                {
+                    "name": "filter_mask",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+                    "description": "Filter mask (hexadecimal)"
+                },
+                {"$ref": "#/components/parameters/ArbitrationHeader"}
+            ],
+            "responses": {
+                "200": {
+                    "description": "Session opened successfully",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {"type": "integer"}
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/sessions/open/{bus_id}/{filter_id}/{filter_mask}": {
-                "post": {
-                    "summary": "Open Session",
-                    "description": "Creates a CAN session with filtering",
-                    "parameters": [
-                        {
-                            "name": "bus_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Bus ID (hexadecimal)"
-                        },
-                        {
-                            "name": "filter_id",
-                            "in": "path", 
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Filter ID (hexadecimal)"
-                        },
-                        {
-                            "name": "filter_mask",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Filter mask (hexadecimal)"
-                        },
-                        {
-                            "name": "X-Arbitration",
-                            "in": "header",
-                            "required": False,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}$"},
-                            "description": "Device arbitration ID (6-byte array in format XX-XX-XX-XX-XX-XX)"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Session opened successfully",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
+            }
+        }
+    },
+    "/sessions/{bus_id}/{session_id}/enumerate": {
+        "get": {
+            "summary": "Enumerate Bus",
+            "description": "Discovers devices on the CAN bus",
+            "parameters": [
+                {"$ref": "#/components/parameters/BusId"},
+                {"$ref": "#/components/parameters/SessionId"}
+            ],
+            "responses": {
+                "200": {
+                    "description": "Device enumeration results",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "known_ids": {
                                         "type": "object",
-                                        "properties": {
-                                            "id": {"type": "integer"}
-                                        }
+                                        "additionalProperties": {"$ref": "#/components/schemas/SixByteSerial"},
+                                        "description": "CAN ID to serial number mapping"
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/sessions/{bus_id}/{session_id}/enumerate": {
-                "get": {
-                    "summary": "Enumerate Bus",
-                    "description": "Discovers devices on the CAN bus",
-                    "parameters": [
-                        {
-                            "name": "bus_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Bus ID (hexadecimal)"
-                        },
-                        {
-                            "name": "session_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Session ID (hexadecimal)"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Device enumeration results",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
+            }
+        }
+    },
+    "/sessions/{bus_id}/{session_id}/conflicts": {
+        "get": {
+            "summary": "Get Conflicts",
+            "description": "Returns CAN ID conflicts on the bus",
+            "parameters": [
+                {"$ref": "#/components/parameters/BusId"},
+                {"$ref": "#/components/parameters/SessionId"}
+            ],
+            "responses": {
+                "200": {
+                    "description": "Conflict information",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "conflicts": {
                                         "type": "object",
-                                        "properties": {
-                                            "known_ids": {
-                                                "type": "object",
-                                                "additionalProperties": {
-                                                    "type": "array",
-                                                    "items": {"type": "integer", "minimum": 0, "maximum": 255},
-                                                    "minItems": 6,
-                                                    "maxItems": 6,
-                                                    "description": "6-byte serial number"
-                                                },
-                                                "description": "CAN ID to serial number mapping"
-                                            }
-                                        }
+                                        "additionalProperties": {
+                                            "type": "array",
+                                            "items": {"$ref": "#/components/schemas/SixByteSerial"}
+                                        },
+                                        "description": "CAN ID to array of conflicting serial numbers"
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/sessions/{bus_id}/{session_id}/conflicts": {
-                "get": {
-                    "summary": "Get Conflicts",
-                    "description": "Returns CAN ID conflicts on the bus",
-                    "parameters": [
-                        {
-                            "name": "bus_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Bus ID (hexadecimal)"
-                        },
-                        {
-                            "name": "session_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Session ID (hexadecimal)"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Conflict information",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "conflicts": {
-                                                "type": "object",
-                                                "additionalProperties": {
-                                                    "type": "array",
-                                                    "items": {
-                                                        "type": "array",
-                                                        "items": {"type": "integer", "minimum": 0, "maximum": 255},
-                                                        "minItems": 6,
-                                                        "maxItems": 6,
-                                                        "description": "6-byte serial number"
-                                                    }
-                                                },
-                                                "description": "CAN ID to array of conflicting serial numbers"
-                                            }
-                                        }
-                                    }
+            }
+        }
+    },
+    "/devices/{bus_id}/{session_id}/{device_id}/settings": {
+        "get": {
+            "summary": "Get Device Settings",
+            "description": "Retrieves cached device settings",
+            "parameters": [
+                {"$ref": "#/components/parameters/BusId"},
+                {"$ref": "#/components/parameters/SessionId"},
+                {"$ref": "#/components/parameters/DeviceId"}
+            ],
+            "responses": {
+                "200": {
+                    "description": "Device settings",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "setting": {"type": "object"}
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/devices/{bus_id}/{session_id}/{device_id}/settings": {
-                "get": {
-                    "summary": "Get Device Settings",
-                    "description": "Retrieves cached device settings",
-                    "parameters": [
-                        {
-                            "name": "bus_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Bus ID (hexadecimal)"
-                        },
-                        {
-                            "name": "session_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Session ID (hexadecimal)"
-                        },
-                        {
-                            "name": "device_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Device ID (hexadecimal)"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Device settings",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
+            }
+        }
+    },
+    "/devices/{bus_id}/{session_id}/{device_id}/name": {
+        "get": {
+            "summary": "Get Device Name",
+            "description": "Gets device name information",
+            "parameters": [
+                {"$ref": "#/components/parameters/BusId"},
+                {"$ref": "#/components/parameters/SessionId"},
+                {"$ref": "#/components/parameters/DeviceId"},
+                {"$ref": "#/components/parameters/ArbitrationHeader"}
+            ],
+            "responses": {
+                "200": {
+                    "description": "Device name information",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {
                                         "type": "object",
-                                        "properties": {
-                                            "setting": {"type": "object"}
-                                        }
+                                        "additionalProperties": {
+                                            "type": "array",
+                                            "items": {"type": "integer", "minimum": 0, "maximum": 255},
+                                            "minItems": 6,
+                                            "maxItems": 6,
+                                            "description": "6-byte name setting"
+                                        },
+                                        "description": "Setting ID to name data mapping"
                                     }
                                 }
                             }
                         }
                     }
                 }
-            },
-            "/devices/{bus_id}/{session_id}/{device_id}/name": {
-                "get": {
-                    "summary": "Get Device Name",
-                    "description": "Gets device name information",
-                    "parameters": [
-                        {
-                            "name": "bus_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Bus ID (hexadecimal)"
-                        },
-                        {
-                            "name": "session_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Session ID (hexadecimal)"
-                        },
-                        {
-                            "name": "device_id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
-                            "description": "Device ID (hexadecimal)"
-                        },
-                        {
-                            "name": "X-Arbitration",
-                            "in": "header",
-                            "required": False,
-                            "schema": {"type": "string", "pattern": "^[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}-[0-9a-fA-F]{2}$"},
-                            "description": "Device arbitration ID (6-byte array in format XX-XX-XX-XX-XX-XX)"
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Device name information",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "name": {
-                                                "type": "object",
-                                                "additionalProperties": {
-                                                    "type": "array",
-                                                    "items": {"type": "integer", "minimum": 0, "maximum": 255},
-                                                    "minItems": 6,
-                                                    "maxItems": 6,
-                                                    "description": "6-byte name setting"
-                                                },
-                                                "description": "Setting ID to name data mapping"
-                                            }
-                                        }
-                                    }
-                                }
-                            }
+            }
+        }
+    }
+}
+
+_STATIC_TAGS = [
+    {
+        "name": "General",
+        "description": "General API endpoints"
+    },
+    {
+        "name": "Bus Management", 
+        "description": "CAN bus connection management"
+    },
+    {
+        "name": "Session Management",
+        "description": "CAN session management and device discovery"
+    },
+    {
+        "name": "Device Management",
+        "description": "Device-specific operations"
+    }
+]
+
+_MESSAGE_ENDPOINT_PARAMS = [
+    {
+        "name": "bus_id",
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+        "description": "CAN bus ID (hexadecimal)"
+    },
+    {
+        "name": "session_id", 
+        "in": "path",
+        "required": True,
+        "schema": {"type": "string", "pattern": "^[0-9a-fA-F]+$"},
+        "description": "Session ID (hexadecimal)"
+    }
+]
+
+_NOT_FOUND_RESPONSE = {
+    "description": "Not found"
+}
+
+def _make_message_endpoint(name: str, comment: str, schema_name: str) -> Dict[str, Any]:
+    """Build the GET endpoint for one message; the parameter list and 404 response are shared between endpoints"""
+    return {
+        "get": {
+            "summary": f"Get {name} message",
+            "description": comment,
+            "parameters": _MESSAGE_ENDPOINT_PARAMS,
+            "responses": {
+                "200": {
+                    "description": "Success",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": f"#/components/schemas/{schema_name}"}
                         }
                     }
-                }
+                },
+                "404": _NOT_FOUND_RESPONSE
             }
+        }
+    }
+
+# message sources that send data device -> host, and so get an endpoint
+_DEVICE_SOURCES = frozenset(("device", "both"))
+
+def generate_openapi_spec(dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
+    """Generate complete OpenAPI specification for a device"""
+    
+    # Base OpenAPI specification
+    openapi_spec = {
+        "openapi": "3.0.3",
+        "info": {
+            "title": f"{dev.name} CAN API",
+            "description": f"REST API for {dev.name} CAN device communication",
+            "version": "1.0.0"
         },
+        "servers": _SERVERS,
+        "paths": dict(_STATIC_PATHS),
         "components": {
-            "schemas": message_schemas,
+            "schemas": dict(_STATIC_SCHEMAS),
+            "parameters": _STATIC_PARAMETERS,
             "securitySchemes": {
                 "CORS": {
                     "type": "apiKey",
@@ -550,23 +594,7 @@ def generate_openapi_spec(dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
             }
         },
         "security": [],
-        "tags": [
-            {
-                "name": "General",
-                "description": "General API endpoints"
-            },
-            {
-                "name": "Bus Management", 
-                "description": "CAN bus connection management"
-            },
-            {
-                "name": "Session Management",
-                "description": "CAN session management and device discovery"
-            },
-            {
-                "name": "Device Management",
-                "description": "Device-specific operations"
-            },
+        "tags": _STATIC_TAGS + [
             {
                 "name": f"{dev.name} Messages",
                 "description": f"Message endpoints for {dev.name} device"
@@ -574,19 +602,51 @@ def generate_openapi_spec(dev: toml_defs.DeviceSpec) -> Dict[str, Any]:
         ]
     }
     
-    # Add device-specific message endpoints
-    openapi_spec["paths"].update(message_endpoints)
+    # Add a schema and an endpoint for every public message sent from device to host
+    message_schemas = openapi_spec["components"]["schemas"]
+    message_endpoints = openapi_spec["paths"]
+    endpoint_prefix = f"/{dev.name.lower()}/{{bus_id}}/{{session_id}}/"
+    for name, msg in dev.msg.items():
+        if not (msg.is_public and msg.source in _DEVICE_SOURCES):
+            continue
+        schema_name = f"{name}Message"
+        message_schemas[schema_name] = generate_message_schema(msg, dev)
+        
+        # Convert message name to camelCase for endpoint
+        camel_name = utils.screaming_snake_to_camel(name)
+        
+        # Create endpoint for this message
+        endpoint_path = endpoint_prefix + camel_name
+        message_endpoints[endpoint_path] = _make_message_endpoint(name, msg.comment, schema_name)
     
     return openapi_spec
 
-def gen_openapi_spec(dev: toml_defs.DeviceSpec, file: Path):
-    """Generate OpenAPI specification for a device"""
+_TARGET = Path("target/openapi")
+_TARGET_READY = False
+
+def _write_json(spec: Dict[str, Any], path: Path):
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(spec, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", buffering=1 << 20) as f:
+            json.dump(spec, f, indent=2)
+
+def gen_openapi_spec(dev: toml_defs.DeviceSpec, file: Path, fmt: str = "yaml"):
+    """Generate OpenAPI specification for a device, written as yaml (default) or json"""
+    global _TARGET_READY
     spec = generate_openapi_spec(dev)
     
-    # Write to target directory
-    Path("target/openapi").mkdir(parents=True, exist_ok=True)
-    with open(f"target/openapi/{dev.name.lower()}.yaml", "w") as f:
-        yaml.dump(spec, f, default_flow_style=False, sort_keys=False)
+    # Write to target directory, creating it on the first spec only
+    if not _TARGET_READY:
+        _TARGET.mkdir(parents=True, exist_ok=True)
+        _TARGET_READY = True
+    if fmt == "json":
+        # OpenAPI tools take json just as well, and it skips the (slow) yaml emitter entirely
+        _write_json(spec, _TARGET / f"{dev.name.lower()}.json")
+        return spec
+    # the dumper emits lots of tiny writes; let them collect in one big buffer
+    with open(_TARGET / f"{dev.name.lower()}.yaml", "w", buffering=1 << 20) as f:
+        yaml.dump(spec, f, Dumper=_SpecDumper, default_flow_style=False, sort_keys=False)
     
     return spec
 
@@ -594,13 +654,17 @@ if __name__ == "__main__":
     import sys
     from pathlib import Path
     
-    if len(sys.argv) < 2:
-        print("Usage: python openapi.py <device_toml_file>")
+    args = sys.argv[1:]
+    fmt = "yaml"
+    if args and args[0].startswith("--format="):
+        fmt = args.pop(0).split("=", 1)[1]
+    if len(args) < 1 or fmt not in ("yaml", "json"):
+        print("Usage: python openapi.py [--format=yaml|json] <device_toml_file>")
         sys.exit(1)
     
-    file_path = Path(sys.argv[1])
+    file_path = Path(args[0])
     dev = parse_spec(file_path)
-    spec = gen_openapi_spec(dev, file_path)
+    spec = gen_openapi_spec(dev, file_path, fmt)
     
     print(f"Generated OpenAPI spec for {dev.name}")
-    print(f"Spec written to: target/openapi/{dev.name.lower()}.yaml")
+    print(f"Spec written to: target/openapi/{dev.name.lower()}.{fmt}")
@@ -1,6 +1,7 @@
 import typing
 import textwrap
 import enum
+import io
 import math
 from pathlib import Path
 
@@ -25,7 +26,7 @@ bitset_template = """class {name}(enum.Flag):
 """
 
 struct_template = """
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class {name}:
 {entries}
 """
@@ -33,16 +34,21 @@ class {name}:
 def indent4(s: str) -> str:
     return textwrap.indent(s, "    ")
 
+def member_doc(s: str) -> str:
+    """doc_comment indented as a class member"""
+    if "\n" not in s:
+        # single line: nothing for textwrap to decide, so skip it
+        return f'    """{s}"""'
+    return indent4(doc_comment(s))
+
 def gen_enumers(dev: Device) -> str:
     enumers = []
     for name, enum_meta in dev.enums.items():
-        entries = []
-        for _, ent in enum_meta.values.items():
-            entries.append(f"    {ent.name} = 0x{ent.index:x}")
-            entries.append(indent4(doc_comment(ent.comment)))
         enumers.append(enum_template.format(
             name = utils.screaming_snake_to_camel(name),
-            entries = "\n".join(entries)
+            entries = "\n".join(
+                f"    {ent.name} = 0x{ent.index:x}\n{member_doc(ent.comment)}"
+                for ent in enum_meta.values.values())
         ))
     
     return "\n".join(enumers)
@@ -50,20 +56,20 @@ def gen_enumers(dev: Device) -> str:
 def gen_bitsets(dev: Device) -> str:
     bitsets = []
     for name, bitset_meta in dev.bitsets.items():
-        entries = []
-        for ent in bitset_meta.flags:
-            entries.append(f"    {ent.name.upper()} = 0x{1 << ent.bit_idx:x}")
-            entries.append(indent4(doc_comment(ent.comment)))
         bitsets.append(bitset_template.format(
             name = utils.screaming_snake_to_camel(name),
-            entries = "\n".join(entries) or "    pass"
+            entries = "\n".join(
+                f"    {ent.upper_name} = 0x{ent.mask:x}\n{member_doc(ent.comment)}"
+                for ent in bitset_meta.flags) or "    pass"
         ))
     
     return "\n".join(bitsets)
 
 def gen_composite_signal(signals: typing.List[Signal], prefix="") -> str:
+    return "\n".join(iter_composite_signal(signals, prefix))
+
+def iter_composite_signal(signals: typing.List[Signal], prefix="") -> typing.Iterator[str]:
     idx = 0
-    entries = []
     for ent in signals:
         dtype_name = name_for_dtype(ent.dtype, prefix=prefix)
         if dtype_name is None:
@@ -73,16 +79,14 @@ def gen_composite_signal(signals: typing.List[Signal], prefix="") -> str:
         if ent.optional:
             dtype_name = f"Optional[{dtype_name}]"
             active_sig_template = sig_template_optional
-        entries.append(active_sig_template.format(
+        yield active_sig_template.format(
             name = ent.name,
             htype = dtype_name,
             offset = idx,
             dtype = meta_for_dtype(ent.dtype, prefix=prefix)
-        ))
-        entries.append(indent4(doc_comment(ent.comment)))
+        )
+        yield member_doc(ent.comment)
         idx += ent.dtype.bit_length()
-    
-    return "\n".join(entries)
 
 
 def gen_structs(dev: Device) -> str:
@@ -97,71 +101,74 @@ def gen_structs(dev: Device) -> str:
     return "\n".join(structs)
 
 
-def name_for_dtype(dtype: DType, prefix="") -> str | None:
-    match dtype.meta:
-        case UIntMeta():
-            return "int"
-        case SIntMeta():
-            return "int"
-        case FloatMeta():
-            return "float"
-        case BoolMeta():
-            return "bool"
-        case PadMeta():
-            return None
-        case StructMeta():
-            return prefix + utils.screaming_snake_to_camel(dtype.meta.name)
-        case BitsetMeta():
-            return prefix + utils.screaming_snake_to_camel(dtype.meta.name)
-        case BufMeta():
-            return "bytearray"
-        case EnumMeta():
-            return prefix + utils.screaming_snake_to_camel(dtype.meta.name)
-        case _:
-            return None
+# name_for_dtype and meta_for_dtype dispatch on type(meta) through these tables rather than walking a match statement.
+# PadMeta (and a missing meta) has no entry, so both return None for it.
 
-def meta_for_dtype(dtype: DType, prefix="") -> str | None:
-    meta = dtype.meta
-    match meta:
-        case UIntMeta():
-            return (f"UInt(width={meta.width}, min={meta.min}, max={meta.max}, default_value={meta.default_value}, "
-                    f"factor_num={meta.factor_num}, factor_den={meta.factor_den}, offset={meta.offset})")
-        case SIntMeta():
-            return (f"SInt(width={meta.width}, min={meta.min}, max={meta.max}, default_value={meta.default_value}, "
-                    f"factor_num={meta.factor_num}, factor_den={meta.factor_den}, offset={meta.offset})")
-        case FloatMeta():
-            default_value = meta.default_value
-            if not math.isfinite(default_value):
-                if math.isnan(default_value):
-                    default_value = "math.nan"
-                elif math.isinf(default_value):
-                    if default_value < 0.0:
-                        default_value = "-math.inf"
-                    else:
-                        default_value = "math.inf"
-
-            return (f"Float(width={meta.width}, min={meta.min}, max={meta.max}, default_value={default_value}, "
-                    f"allow_nan_inf={meta.allow_nan_inf}, factor_num={meta.factor_num}, factor_den={meta.factor_den}, offset={meta.offset})")
-        case BoolMeta():
-            return f"Boolean({meta.default_value})"
-        case PadMeta():
-            return None
-        case StructMeta():
-            return f"Struct({prefix + utils.screaming_snake_to_camel(dtype.meta.name)})"
-        case BitsetMeta():
-            return f"Bitset(width={meta.width}, dtype={prefix + utils.screaming_snake_to_camel(dtype.meta.name)}, default_value={meta.default_u64()})"
-        case BufMeta():
-            return f"Buffer(width={meta.width}, default_value={meta.default_value.to_bytes((meta.width + 7) // 8, 'little')})"
-        case EnumMeta():
-            dtype = prefix + utils.screaming_snake_to_camel(dtype.meta.name)
-            if meta.default_value:
-                default_value = f"{dtype}.{meta.default_value}"
+def _named_type(meta, prefix: str) -> str:
+    return prefix + meta.camel_name
+
+_NAME_FOR_META = {
+    UIntMeta: lambda meta, prefix: "int",
+    SIntMeta: lambda meta, prefix: "int",
+    FloatMeta: lambda meta, prefix: "float",
+    BoolMeta: lambda meta, prefix: "bool",
+    StructMeta: _named_type,
+    BitsetMeta: _named_type,
+    BufMeta: lambda meta, prefix: "bytearray",
+    EnumMeta: _named_type,
+}
+
+def name_for_dtype(dtype: DType, prefix="") -> str | None:
+    handler = _NAME_FOR_META.get(type(dtype.meta))
+    if handler is None:
+        return None
+    return handler(dtype.meta, prefix)
+
+def _int_meta(cls_name: str):
+    def fmt(meta, prefix: str) -> str:
+        return (f"{cls_name}(width={meta.width}, min={meta.min}, max={meta.max}, default_value={meta.default_value}, "
+                f"factor_num={meta.factor_num}, factor_den={meta.factor_den}, offset={meta.offset})")
+    return fmt
+
+def _float_meta(meta: FloatMeta, prefix: str) -> str:
+    default_value = meta.default_value
+    if not math.isfinite(default_value):
+        if math.isnan(default_value):
+            default_value = "math.nan"
+        elif math.isinf(default_value):
+            if default_value < 0.0:
+                default_value = "-math.inf"
             else:
-                default_value = 0
+                default_value = "math.inf"
+
+    return (f"Float(width={meta.width}, min={meta.min}, max={meta.max}, default_value={default_value}, "
+            f"allow_nan_inf={meta.allow_nan_inf}, factor_num={meta.factor_num}, factor_den={meta.factor_den}, offset={meta.offset})")
+
+def _enum_meta(meta: EnumMeta, prefix: str) -> str:
+    dtype = _named_type(meta, prefix)
+    if meta.default_value:
+        default_value = f"{dtype}.{meta.default_value}"
+    else:
+        default_value = 0
+
+    return f"Enum(width={meta.width}, dtype={dtype}, default_value={default_value})"
+
+_META_FOR_META = {
+    UIntMeta: _int_meta("UInt"),
+    SIntMeta: _int_meta("SInt"),
+    FloatMeta: _float_meta,
+    BoolMeta: lambda meta, prefix: f"Boolean({meta.default_value})",
+    StructMeta: lambda meta, prefix: f"Struct({_named_type(meta, prefix)})",
+    BitsetMeta: lambda meta, prefix: f"Bitset(width={meta.width}, dtype={_named_type(meta, prefix)}, default_value={meta.default_u64()})",
+    BufMeta: lambda meta, prefix: f"Buffer(width={meta.width}, default_value={meta.default_value.to_bytes((meta.width + 7) // 8, 'little')})",
+    EnumMeta: _enum_meta,
+}
 
-            return f"Enum(width={meta.width}, dtype={dtype}, default_value={default_value})"
-        case _:
-            return None
+def meta_for_dtype(dtype: DType, prefix="") -> str | None:
+    handler = _META_FOR_META.get(type(dtype.meta))
+    if handler is None:
+        return None
+    return handler(dtype.meta, prefix)
 
 def gen_types(dev: Device) -> str:
     return f"""import enum
@@ -180,7 +187,7 @@ sig_template = """    {name}: Annotated[{htype}, Signal({offset}, {dtype})]"""
 sig_template_optional = """    {name}: Annotated[{htype}, Signal({offset}, {dtype}, optional=True)]"""
 
 msg_template = """
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class {name}(BaseMessage):
 {comment}
     __meta__ = MessageMeta(device_type={device_type}, id={id}, min_length={min_length}, max_length={max_length})
@@ -196,13 +203,16 @@ from pycanandmessage.model import *
 """
 
 def gen_msg(dev: Device) -> str:
-    variants = [msg_header]
+    # written straight into one buffer; the tail used to be concatenated onto the full joined module
+    buf = io.StringIO()
+    buf.write(msg_header)
     names = []
     for name, msg in dev.messages.items():
         entries = gen_composite_signal(msg.signals, prefix="device_types.")
         camel_name = utils.screaming_snake_to_camel(name)
         names.append(camel_name)
-        variants.append(msg_template.format(
+        buf.write("\n")
+        buf.write(msg_template.format(
             name = camel_name,
             comment = f"    {doc_comment(msg.comment)}",
             entries = entries,
@@ -213,9 +223,9 @@ def gen_msg(dev: Device) -> str:
             max_length = msg.max_length,
         ))
     
-    variants.append("__all__ = ['MessageType', " + ", ".join(map(repr, names)) + "]")
-    
-    return "\n".join(variants) + "\n\ntype MessageType = " + " | ".join(names)
+    buf.write("\n__all__ = ['MessageType', " + ", ".join(map(repr, names)) + "]")
+    buf.write("\n\ntype MessageType = " + " | ".join(names))
+    return buf.getvalue()
 
 
 stg_header = """
@@ -234,7 +244,7 @@ type SettingType = {names_or}
 """
 
 stg_template = """
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class {name}(BaseSetting):
 {comment}
     __meta__ = SettingMeta(idx=0x{idx:x}, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -287,31 +297,30 @@ class {cname}(BaseDevice):
 def gen_device(dev: Device, pkg_root: Path):
     dev_dir = Path(pkg_root)/dev.name.lower()
     dev_dir.mkdir(parents=True, exist_ok=True)
-    # device/__init__.py
 
-    with open(dev_dir/"__init__.py", "w") as f:
-        f.write(device_template.format(
+    writes = [
+        (dev_dir/"__init__.py", device_template.format(
             dev_type = dev.dev_type,
             cname = dev.name.capitalize(), 
             msg_map = "{\n" + textwrap.indent(
                 "\n".join(
                     f'{ent.id}: msg.{utils.screaming_snake_to_camel(name)},' 
-                    for name, ent in dev.messages.items()), " " * 8) + "\n    }"))
-    
-    # device/types.py
-    with open(dev_dir/"types.py", "w") as f:
-        f.write(gen_types(dev))
-    
-    # device/message.py
-    with open(dev_dir/"message.py", "w") as f:
-        f.write(gen_msg(dev))
-    
-    # device/setting.py
-    with open(dev_dir/"setting.py", "w") as f:
-        f.write(gen_stg(dev))
+                    for name, ent in dev.messages.items()), " " * 8) + "\n    }")),
+        (dev_dir/"types.py", gen_types(dev)),
+        (dev_dir/"message.py", gen_msg(dev)),
+        (dev_dir/"setting.py", gen_stg(dev)),
+    ]
+    for file, text in writes:
+        file.write_text(text)
+
+def gen_one(toml_file: Path, pkg_root: Path = Path("pycanandmessage")):
+    """Parse one device spec and generate its package; runs in a worker process"""
+    gen_device(parse_spec_to_device(toml_file), pkg_root)
 
 if __name__ == "__main__":
     import sys
+    from concurrent.futures import ProcessPoolExecutor
     path = Path(sys.argv[1])
-    for toml_file in path.glob("*.toml"):
-        gen_device(parse_spec_to_device(toml_file), "pycanandmessage")
\ No newline at end of file
+    # devices generate into separate directories and share no state, so spread them over processes
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(gen_one, path.glob("*.toml")))
\ No newline at end of file
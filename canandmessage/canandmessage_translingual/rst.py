@@ -1,16 +1,26 @@
-from typing import Type, Dict, Tuple, List
+from typing import Any, Type, Dict, Tuple, List, Optional
 from pathlib import Path
 from enum import Enum
 import jinja2
 import os
 import csv
+import re
+import functools
+import weakref
 
 from canandmessage_translingual.canandmessage_parser.model_impl import impl_DType_from_sig, impl_DType_from_type
 from .canandmessage_parser import *
 from .canandmessage_parser import toml_defs
 from .canandmessage_parser import DTypeOnion
 
-env = jinja2.Environment(loader=jinja2.FileSystemLoader(Path(__file__).parent))
+# templates don't change under a running generator, so skip the mtime checks and keep compiled
+# templates in jinja's per-user bytecode cache between runs
+env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+_SPEC_TEMPLATE = env.get_template("spec_template.rst.j2")
 
 def header(s, c="=") -> str:
     """Generates a restructured text header"""
@@ -20,20 +30,20 @@ def table(headers, body, enable_header=True) -> str:
     headers = [*map(str, headers)]
     body = [[*map(str, line)] for line in body]
     max_lens = [len(h) + 8 for h in headers]
-    for line in body:
-        for i in range(len(max_lens)):
-            max_lens[i] = max(max_lens[i], len(line[i]))
+    if body:
+        # scan column-wise so the widest cell per column comes out of one max() call
+        max_lens = [max(l, *map(len, col)) for l, col in zip(max_lens, zip(*body))]
     
     edge_border = "  ".join(["=" * m for m in max_lens])
     title = "  ".join([f"**{h}**".ljust(l) for h, l in zip(headers, max_lens)])
     if enable_header:
-        buf = f"\n{edge_border}\n{title}\n{edge_border}\n"
+        buf = [edge_border, title, edge_border]
     else:
-        buf = f"\n{edge_border}\n"
-    for line in body:
-        buf +=  "  ".join([v.ljust(l) for v, l in zip(line, max_lens)]) + "\n"
+        buf = [edge_border]
+    buf.extend(["  ".join([v.ljust(l) for v, l in zip(line, max_lens)]) for line in body])
+    buf.append(edge_border)
     
-    return buf + edge_border + "\n"
+    return "\n" + "\n".join(buf) + "\n"
 
 def csv2table(csv_str: str):
     reader = csv.reader(csv_str.splitlines())
@@ -50,7 +60,9 @@ def csv2table(csv_str: str):
     line_fmt = "|" + "|".join(" {: <" + str(c) + "} " for c in column_lengths) + "|"
 
     buf = [horiz_border, line_fmt.format(*header), horiz_border.replace("-", "=")]
-    buf.extend(line_fmt.format(*line) + "\n" + horiz_border for line in rest)
+    for line in rest:
+        buf.append(line_fmt.format(*line))
+        buf.append(horiz_border)
 
     return "\n".join(buf)
 
@@ -58,27 +70,32 @@ class ReadState(Enum):
     ENTRY = 0
     COLLECT = 1
 
+_TRAILING_WS = re.compile(r"[ \t\f\v]+$", re.M)
+_SECTION_LABEL = re.compile(r"^\.\. _(.*):$", re.M)
+
+@functools.lru_cache(maxsize=256)
+def _parse_rst_sections(path: str, mtime: float) -> Dict[str, str]:
+    """Splits an external rst file into its labelled sections. mtime is only part of the cache key."""
+    with open(path) as f:
+        rst = f.read()
+
+    # strip trailing whitespace from every line up front, then slice the text between labels
+    rst = _TRAILING_WS.sub("", rst)
+    sections: Dict[str, str] = {}
+    labels = list(_SECTION_LABEL.finditer(rst))
+    ends = [m.start() for m in labels[1:]] + [len(rst)]
+    for m, end in zip(labels, ends):
+        body = rst[m.end() + 1:end]
+        sections[m[1]] = body[:-1] if body.endswith("\n") else body
+    return sections
+
 def read_external_rst(rst_root: Path, dev: toml_defs.DeviceSpec) -> Dict[str, str]:
 
     info: Dict[str, str] = {}
     for rst_name in list(dev.base) + [dev.name.lower()]:
-        with open(rst_root/f"{rst_name.lower()}.rst") as f:
-            rst = f.read()
-        
-        key = None
-        collect = []
-
-        for line in rst.splitlines():
-            line = line.rstrip()
-            if line.startswith(".. _") and line.endswith(":"):
-                if key is not None:
-                    info[key] = "\n".join(collect)
-                key = line[4:-1]
-                collect = []
-            else:
-                collect.append(line)
-        if key is not None:
-            info[key] = "\n".join(collect)
+        # base device rst files are shared between devices, so each one is only parsed once
+        path = (rst_root/f"{rst_name.lower()}.rst").resolve()
+        info.update(_parse_rst_sections(str(path), path.stat().st_mtime))
     
     # let's do some post-processing for frame periods
     for name, msg in dev.msg.items():
@@ -99,12 +116,27 @@ def read_external_rst(rst_root: Path, dev: toml_defs.DeviceSpec) -> Dict[str, st
             
 
 
+def _per_device(fn):
+    """Memoizes fn(dev) for as long as the device spec is alive; the template asks for each list more than once"""
+    cache: "weakref.WeakKeyDictionary[toml_defs.DeviceSpec, Any]" = weakref.WeakKeyDictionary()
+
+    @functools.wraps(fn)
+    def wrapper(dev: toml_defs.DeviceSpec):
+        result = cache.get(dev)
+        if result is None:
+            result = cache[dev] = fn(dev)
+        return result
+    return wrapper
+
+@_per_device
 def renderable_messages(dev: toml_defs.DeviceSpec) -> List[Tuple[str, toml_defs.DeviceMessageSpec]]:
     return sorted([(name, msg) for name, msg in dev.msg.items() if msg.is_public], key=lambda x: -x[1].id)
 
+@_per_device
 def renderable_settings(dev: toml_defs.DeviceSpec) -> List[Tuple[str, toml_defs.DeviceSettingSpec]]:
     return sorted([(name, stg) for name, stg in dev.settings.items() if stg.is_public], key=lambda x: -x[1].id)
 
+@_per_device
 def renderable_setting_commands(dev: toml_defs.DeviceSpec) -> List[Tuple[str, toml_defs.SettingCommandSpec]]:
     return sorted([(name, cmd) for name, cmd in dev.setting_commands.items()], key=lambda x: x[1].id)
 
@@ -179,15 +211,11 @@ def render_stg_default_value(dev: toml_defs.DeviceSpec, stg: toml_defs.DeviceSet
     return render_default_value(dev, dtype_str, stg.default_value, dtype)
 
 
-def render_default_value(dev: toml_defs.DeviceSpec, dtype: str, default_value, dtype_obj: DType = None) -> str:
+@functools.lru_cache(maxsize=None, typed=True)
+def _render_plain_default(dtype: str, default_value) -> Optional[str]:
+    """The renderings that depend only on the dtype string and default value; None if the device is needed."""
     if default_value is None:
-        if dtype.startswith("enum:"):
-            if dtype_obj is not None:
-                meta: EnumMeta = dtype_obj.meta
-                return meta.default_value
-
-            return f":ref:`Enum default<{dev.name.lower()}_enum_{dtype[5:].lower()}>`"
-        elif (dtype.startswith("sint:") or 
+        if (dtype.startswith("sint:") or 
             dtype.startswith("uint:") or
             dtype.startswith("pad:")):
             return "``0``"
@@ -197,26 +225,43 @@ def render_default_value(dev: toml_defs.DeviceSpec, dtype: str, default_value, d
             return "``0.0``"
         elif (dtype.startswith("buf:")):
             return render_buf_int(0, int(dtype[4:]))
-        else:
-            if dtype_obj is not None:
-                meta: DTypeOnion = dtype_obj.meta
-                match meta:
-                    case UIntMeta() | SIntMeta() | FloatMeta() | EnumMeta():
-                        return f"``{str(meta.default_value)}``"
-                    case BoolMeta():
-                        return f"``{str(meta.default_value).lower()}``"
-                    case BufMeta():
-                        return render_buf_int(meta.default_value, meta.width)
-                    case PadMeta():
-                        return "``0``"
-                    case _:
-                        pass
-            return f":ref:`Type default<{dev.name.lower()}_type_{dtype.lower()}>`"
+        return None
     else:
         if dtype.startswith("buf:") and isinstance(default_value, int):
             return render_buf_int(default_value, int(dtype[4:]))
         return str(default_value)
 
+def render_default_value(dev: toml_defs.DeviceSpec, dtype: str, default_value, dtype_obj: DType = None) -> str:
+    if not dtype.startswith("enum:") or default_value is not None:
+        try:
+            rendered = _render_plain_default(dtype, default_value)
+        except TypeError:
+            # unhashable default value; render it without the cache
+            rendered = _render_plain_default.__wrapped__(dtype, default_value)
+        if rendered is not None:
+            return rendered
+
+    if dtype.startswith("enum:"):
+        if dtype_obj is not None:
+            meta: EnumMeta = dtype_obj.meta
+            return meta.default_value
+
+        return f":ref:`Enum default<{dev.name.lower()}_enum_{dtype[5:].lower()}>`"
+    if dtype_obj is not None:
+        meta: DTypeOnion = dtype_obj.meta
+        match meta:
+            case UIntMeta() | SIntMeta() | FloatMeta() | EnumMeta():
+                return f"``{str(meta.default_value)}``"
+            case BoolMeta():
+                return f"``{str(meta.default_value).lower()}``"
+            case BufMeta():
+                return render_buf_int(meta.default_value, meta.width)
+            case PadMeta():
+                return "``0``"
+            case _:
+                pass
+    return f":ref:`Type default<{dev.name.lower()}_type_{dtype.lower()}>`"
+
 
 def render_stg_summary_table(dev: toml_defs.DeviceSpec) -> str:
     tbl = []
@@ -233,32 +278,45 @@ def render_stg_summary_table(dev: toml_defs.DeviceSpec) -> str:
         ]) 
     return table(["Setting index", "Name", "Type", "Default value", "Readable", "Writable", "Resets to factory default", "Description"], tbl)
 
-def format_dtype(dtype: str) -> str:
-    if dtype.startswith("enum:"):
-        if dtype == "enum:SETTING":
-            return f":ref:`Setting index<{dev.name.lower()}_enum_setting>`"
-
-        return f":ref:`{dtype[5:]}<{dev.name.lower()}_enum_{dtype[5:].lower()}>`"
-    if dtype.startswith("sint:"):
-        return f"``int{dtype[5:]}_t``"
-    if dtype.startswith("uint:"):
-        return f"``uint{dtype[5:]}_t``"
-    if dtype.startswith("buf:"):
-        n_bytes = (int(dtype[4:]) + 1) // 8
-        return f"``uint8_t[{n_bytes}]``"
-    if dtype.startswith("pad:"):
-        return f"``pad{dtype[4:]}_t``"
+def _fmt_enum(dev_name: str, rest: str) -> str:
+    if rest == "SETTING":
+        return f":ref:`Setting index<{dev_name}_enum_setting>`"
+    return f":ref:`{rest}<{dev_name}_enum_{rest.lower()}>`"
+
+def _fmt_buf(dev_name: str, rest: str) -> str:
+    n_bytes = (int(rest) + 1) // 8
+    return f"``uint8_t[{n_bytes}]``"
+
+def _fmt_float(dev_name: str, rest: str) -> str:
+    width = rest[-2:]
+    if width == "24":
+        return "``float24_t``"
+    if width == "32":
+        return "``float32_t``"
+    else:
+        return "``double``"
+
+_FORMAT_DTYPE_PREFIXES = {
+    "enum": _fmt_enum,
+    "sint": lambda dev_name, rest: f"``int{rest}_t``",
+    "uint": lambda dev_name, rest: f"``uint{rest}_t``",
+    "buf": _fmt_buf,
+    "pad": lambda dev_name, rest: f"``pad{rest}_t``",
+    "float": _fmt_float,
+}
+
+@functools.lru_cache(maxsize=None)
+def _format_dtype(dev_name: str, dtype: str) -> str:
+    prefix, sep, rest = dtype.partition(":")
+    if sep and (handler := _FORMAT_DTYPE_PREFIXES.get(prefix)) is not None:
+        return handler(dev_name, rest)
     if dtype == "bool" or dtype == "bit":
         return "``bool``"
-    if dtype.startswith("float:"):
-        width = dtype[-2:]
-        if width == "24":
-            return "``float24_t``"
-        if width == "32":
-            return "``float32_t``"
-        else:
-            return "``double``"
-    return f":ref:`{dtype}<{dev.name.lower()}_type_{dtype.lower()}>`"
+    return f":ref:`{dtype}<{dev_name}_type_{dtype.lower()}>`"
+
+def format_dtype(dtype: str) -> str:
+    # the same few dtype strings recur across every message and setting, so results are memoized per device
+    return _format_dtype(dev.name.lower(), dtype)
 
 def render_setting_table(dev: toml_defs.DeviceSpec, stg: toml_defs.DeviceSettingSpec):
     return table(["Property", "Value"], [
@@ -388,10 +446,12 @@ def render_enum(enum: toml_defs.EnumSpec):
     return f"{prop_table}\n**Enum variants:**\n{variant_table}\n"
 
 def gen_spec(dev: toml_defs.DeviceSpec, file: Path):
+    # the spec documents the SETTING_COMMAND enum and references enum:SETTING dtypes
+    inject_setting_enums(dev)
     rst_root = file.parent/"rst"
     info = read_external_rst(rst_root, dev)
 
-    rendered = env.get_template("spec_template.rst.j2").render(
+    rendered = _SPEC_TEMPLATE.render(
         hex=hex,
         table=table,
         header=header,
@@ -422,8 +482,11 @@ def gen_spec(dev: toml_defs.DeviceSpec, file: Path):
         line = line.strip()
         if line.startswith(dev_header) and line.endswith(":"):
             keys.append(line[len(dev_header):-1])
-    for key in keys:
-        rendered = rendered.replace(f"<{key}>`", f"<{dev.name.lower()}_{key}>`")
+    if keys:
+        # one pass over the document for every key, rather than one full-size replace per key
+        dev_prefix = f"{dev.name.lower()}_"
+        key_ref = re.compile("<(" + "|".join(map(re.escape, keys)) + ")>`")
+        rendered = key_ref.sub(lambda m: f"<{dev_prefix}{m[1]}>`", rendered)
     return rendered
 
 
@@ -5,10 +5,18 @@ Generate OpenAPI specifications for all devices in the messages/ directory.
 
 import sys
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from canandmessage_translingual.openapi import gen_openapi_spec
 from canandmessage_translingual.canandmessage_parser import parse_spec
 
+def generate_one(toml_file: Path, fmt: str = "yaml") -> str:
+    """Parse one device spec and write its OpenAPI spec; runs in a worker process"""
+    dev = parse_spec(toml_file)
+    gen_openapi_spec(dev, toml_file, fmt)
+    return dev.name.lower()
+
 def main():
+    fmt = "json" if "--format=json" in sys.argv[1:] else "yaml"
     messages_dir = Path("messages")
     if not messages_dir.exists():
         print("Error: messages/ directory not found")
@@ -28,17 +36,21 @@ def main():
     
     print("\nGenerating OpenAPI specifications...")
     
-    for toml_file in toml_files:
-        try:
+    # each device is independent and generation is pure-Python CPU work, so spread it over processes
+    with ProcessPoolExecutor() as executor:
+        futures = []
+        for toml_file in toml_files:
             print(f"Processing {toml_file.name}...")
-            dev = parse_spec(toml_file)
-            gen_openapi_spec(dev, toml_file)
-            print(f"  ✓ Generated {dev.name.lower()}.yaml")
-        except Exception as e:
-            print(f"  ✗ Error processing {toml_file.name}: {e}")
+            futures.append(executor.submit(generate_one, toml_file, fmt))
+        for toml_file, future in zip(toml_files, futures):
+            try:
+                name = future.result()
+                print(f"  ✓ Generated {name}.{fmt}")
+            except Exception as e:
+                print(f"  ✗ Error processing {toml_file.name}: {e}")
     
     print(f"\nOpenAPI specifications written to target/openapi/")
-    print("You can now use these YAML files with OpenAPI tools like Swagger UI or Postman.")
+    print(f"You can now use these {fmt.upper()} files with OpenAPI tools like Swagger UI or Postman.")
 
 if __name__ == "__main__":
     main()
@@ -9,7 +9,7 @@ from pycanandmessage.model import *
 __all__ = ['SettingType', 'CanId', 'Name0', 'Name1', 'Name2', 'StatusFramePeriod', 'SerialNumber', 'FirmwareVersion', 'ChickenBits', 'DeviceType', 'Scratch0', 'Scratch1', 'DistanceFramePeriod', 'ColorFramePeriod', 'DigoutFramePeriod', 'DistanceExtraFrameMode', 'ColorExtraFrameMode', 'LampBrightness', 'ColorIntegrationPeriod', 'DistanceIntegrationPeriod', 'Digout1OutputConfig', 'Digout2OutputConfig', 'Digout1MessageOnChange', 'Digout2MessageOnChange', 'Digout1Config0', 'Digout1Config1', 'Digout1Config2', 'Digout1Config3', 'Digout1Config4', 'Digout1Config5', 'Digout1Config6', 'Digout1Config7', 'Digout1Config8', 'Digout1Config9', 'Digout1Config10', 'Digout1Config11', 'Digout1Config12', 'Digout1Config13', 'Digout1Config14', 'Digout1Config15', 'Digout2Config0', 'Digout2Config1', 'Digout2Config2', 'Digout2Config3', 'Digout2Config4', 'Digout2Config5', 'Digout2Config6', 'Digout2Config7', 'Digout2Config8', 'Digout2Config9', 'Digout2Config10', 'Digout2Config11', 'Digout2Config12', 'Digout2Config13', 'Digout2Config14', 'Digout2Config15']
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanId(BaseSetting):
     """CAN Device ID"""
     __meta__ = SettingMeta(idx=0x0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -17,7 +17,7 @@ class CanId(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name0(BaseSetting):
     """device_name[0:5]"""
     __meta__ = SettingMeta(idx=0x1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -25,7 +25,7 @@ class Name0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name1(BaseSetting):
     """device_name[6:11]"""
     __meta__ = SettingMeta(idx=0x2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -33,7 +33,7 @@ class Name1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name2(BaseSetting):
     """device_name[12:17]"""
     __meta__ = SettingMeta(idx=0x3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -41,7 +41,7 @@ class Name2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StatusFramePeriod(BaseSetting):
     """Status frame period (ms)"""
     __meta__ = SettingMeta(idx=0x4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -49,7 +49,7 @@ class StatusFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SerialNumber(BaseSetting):
     """Serial number"""
     __meta__ = SettingMeta(idx=0x5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -57,7 +57,7 @@ class SerialNumber(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion(BaseSetting):
     """Firmware version"""
     __meta__ = SettingMeta(idx=0x6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -65,7 +65,7 @@ class FirmwareVersion(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChickenBits(BaseSetting):
     """Device-specific chicken bits"""
     __meta__ = SettingMeta(idx=0x7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -73,7 +73,7 @@ class ChickenBits(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeviceType(BaseSetting):
     """Device-specific type identifier"""
     __meta__ = SettingMeta(idx=0x8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -81,7 +81,7 @@ class DeviceType(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch0(BaseSetting):
     """User-writable scratch bytes 1"""
     __meta__ = SettingMeta(idx=0x9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -89,7 +89,7 @@ class Scratch0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch1(BaseSetting):
     """User-writable scratch bytes 2"""
     __meta__ = SettingMeta(idx=0xa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -97,7 +97,7 @@ class Scratch1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DistanceFramePeriod(BaseSetting):
     """Distance frame period (ms)"""
     __meta__ = SettingMeta(idx=0xff, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -105,7 +105,7 @@ class DistanceFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ColorFramePeriod(BaseSetting):
     """Color frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfe, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -113,7 +113,7 @@ class ColorFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DigoutFramePeriod(BaseSetting):
     """Digout frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfd, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -121,7 +121,7 @@ class DigoutFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DistanceExtraFrameMode(BaseSetting):
     """Distance extra frame mode"""
     __meta__ = SettingMeta(idx=0xf7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -129,7 +129,7 @@ class DistanceExtraFrameMode(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ColorExtraFrameMode(BaseSetting):
     """Color extra frame frame mode"""
     __meta__ = SettingMeta(idx=0xf6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -137,7 +137,7 @@ class ColorExtraFrameMode(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LampBrightness(BaseSetting):
     """Lamp LED brightness"""
     __meta__ = SettingMeta(idx=0xef, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -145,7 +145,7 @@ class LampBrightness(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ColorIntegrationPeriod(BaseSetting):
     """Color integration period"""
     __meta__ = SettingMeta(idx=0xee, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -153,7 +153,7 @@ class ColorIntegrationPeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DistanceIntegrationPeriod(BaseSetting):
     """Distance integration period"""
     __meta__ = SettingMeta(idx=0xed, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -161,7 +161,7 @@ class DistanceIntegrationPeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1OutputConfig(BaseSetting):
     """Digital output 1 control config"""
     __meta__ = SettingMeta(idx=0xeb, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -169,7 +169,7 @@ class Digout1OutputConfig(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2OutputConfig(BaseSetting):
     """Digital output 2 control config"""
     __meta__ = SettingMeta(idx=0xea, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -177,7 +177,7 @@ class Digout2OutputConfig(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1MessageOnChange(BaseSetting):
     """Digital output 1 send message on change"""
     __meta__ = SettingMeta(idx=0xe9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -185,7 +185,7 @@ class Digout1MessageOnChange(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2MessageOnChange(BaseSetting):
     """Digital output 2 send message on change"""
     __meta__ = SettingMeta(idx=0xe8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -193,7 +193,7 @@ class Digout2MessageOnChange(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config0(BaseSetting):
     """Digout1 config slot 0"""
     __meta__ = SettingMeta(idx=0xd0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -201,7 +201,7 @@ class Digout1Config0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config1(BaseSetting):
     """Digout1 config slot 1"""
     __meta__ = SettingMeta(idx=0xcf, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -209,7 +209,7 @@ class Digout1Config1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config2(BaseSetting):
     """Digout1 config slot 2"""
     __meta__ = SettingMeta(idx=0xce, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -217,7 +217,7 @@ class Digout1Config2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config3(BaseSetting):
     """Digout1 config slot 3"""
     __meta__ = SettingMeta(idx=0xcd, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -225,7 +225,7 @@ class Digout1Config3(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config4(BaseSetting):
     """Digout1 config slot 4"""
     __meta__ = SettingMeta(idx=0xcc, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -233,7 +233,7 @@ class Digout1Config4(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config5(BaseSetting):
     """Digout1 config slot 5"""
     __meta__ = SettingMeta(idx=0xcb, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -241,7 +241,7 @@ class Digout1Config5(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config6(BaseSetting):
     """Digout1 config slot 6"""
     __meta__ = SettingMeta(idx=0xca, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -249,7 +249,7 @@ class Digout1Config6(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config7(BaseSetting):
     """Digout1 config slot 7"""
     __meta__ = SettingMeta(idx=0xc9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -257,7 +257,7 @@ class Digout1Config7(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config8(BaseSetting):
     """Digout1 config slot 8"""
     __meta__ = SettingMeta(idx=0xc8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -265,7 +265,7 @@ class Digout1Config8(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config9(BaseSetting):
     """Digout1 config slot 9"""
     __meta__ = SettingMeta(idx=0xc7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -273,7 +273,7 @@ class Digout1Config9(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config10(BaseSetting):
     """Digout1 config slot 10"""
     __meta__ = SettingMeta(idx=0xc6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -281,7 +281,7 @@ class Digout1Config10(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config11(BaseSetting):
     """Digout1 config slot 11"""
     __meta__ = SettingMeta(idx=0xc5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -289,7 +289,7 @@ class Digout1Config11(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config12(BaseSetting):
     """Digout1 config slot 12"""
     __meta__ = SettingMeta(idx=0xc4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -297,7 +297,7 @@ class Digout1Config12(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config13(BaseSetting):
     """Digout1 config slot 13"""
     __meta__ = SettingMeta(idx=0xc3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -305,7 +305,7 @@ class Digout1Config13(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config14(BaseSetting):
     """Digout1 config slot 14"""
     __meta__ = SettingMeta(idx=0xc2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -313,7 +313,7 @@ class Digout1Config14(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout1Config15(BaseSetting):
     """Digout1 config slot 15"""
     __meta__ = SettingMeta(idx=0xc1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -321,7 +321,7 @@ class Digout1Config15(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config0(BaseSetting):
     """Digout2 config slot 0"""
     __meta__ = SettingMeta(idx=0xc0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -329,7 +329,7 @@ class Digout2Config0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config1(BaseSetting):
     """Digout2 config slot 1"""
     __meta__ = SettingMeta(idx=0xbf, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -337,7 +337,7 @@ class Digout2Config1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config2(BaseSetting):
     """Digout2 config slot 2"""
     __meta__ = SettingMeta(idx=0xbe, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -345,7 +345,7 @@ class Digout2Config2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config3(BaseSetting):
     """Digout2 config slot 3"""
     __meta__ = SettingMeta(idx=0xbd, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -353,7 +353,7 @@ class Digout2Config3(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config4(BaseSetting):
     """Digout2 config slot 4"""
     __meta__ = SettingMeta(idx=0xbc, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -361,7 +361,7 @@ class Digout2Config4(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config5(BaseSetting):
     """Digout2 config slot 5"""
     __meta__ = SettingMeta(idx=0xbb, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -369,7 +369,7 @@ class Digout2Config5(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config6(BaseSetting):
     """Digout2 config slot 6"""
     __meta__ = SettingMeta(idx=0xba, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -377,7 +377,7 @@ class Digout2Config6(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config7(BaseSetting):
     """Digout2 config slot 7"""
     __meta__ = SettingMeta(idx=0xb9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -385,7 +385,7 @@ class Digout2Config7(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config8(BaseSetting):
     """Digout2 config slot 8"""
     __meta__ = SettingMeta(idx=0xb8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -393,7 +393,7 @@ class Digout2Config8(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config9(BaseSetting):
     """Digout2 config slot 9"""
     __meta__ = SettingMeta(idx=0xb7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -401,7 +401,7 @@ class Digout2Config9(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config10(BaseSetting):
     """Digout2 config slot 10"""
     __meta__ = SettingMeta(idx=0xb6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -409,7 +409,7 @@ class Digout2Config10(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config11(BaseSetting):
     """Digout2 config slot 11"""
     __meta__ = SettingMeta(idx=0xb5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -417,7 +417,7 @@ class Digout2Config11(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config12(BaseSetting):
     """Digout2 config slot 12"""
     __meta__ = SettingMeta(idx=0xb4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -425,7 +425,7 @@ class Digout2Config12(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config13(BaseSetting):
     """Digout2 config slot 13"""
     __meta__ = SettingMeta(idx=0xb3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -433,7 +433,7 @@ class Digout2Config13(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config14(BaseSetting):
     """Digout2 config slot 14"""
     __meta__ = SettingMeta(idx=0xb2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -441,7 +441,7 @@ class Digout2Config14(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Digout2Config15(BaseSetting):
     """Digout2 config slot 15"""
     __meta__ = SettingMeta(idx=0xb1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -321,7 +321,7 @@ class DigoutCond(enum.Flag):
     """Slot 15"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingFlags:
     ephemeral: Annotated[bool, Signal(0, Boolean(False))]
     """Whether the setting should be set ephemeral"""
@@ -331,7 +331,7 @@ class SettingFlags:
     """Synch message count"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion:
     firmware_patch: Annotated[int, Signal(0, UInt(width=8, min=0, max=255, default_value=0, factor_num=1, factor_den=1, offset=0))]
     """Firmware version patch number"""
@@ -341,7 +341,7 @@ class FirmwareVersion:
     """Firmware version year"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DigoutControlConfig:
     output_config: Annotated[DigoutOutputConfig, Signal(0, Enum(width=8, dtype=DigoutOutputConfig, default_value=DigoutOutputConfig.DISABLED))]
     """Enable digout pad"""
@@ -349,7 +349,7 @@ class DigoutControlConfig:
     """The data source to use in PWM mode."""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DigoutMessageTrigger:
     positive_edge: Annotated[bool, Signal(0, Boolean(False))]
     """Send digout message on positive edge (false->true)"""
@@ -357,7 +357,7 @@ class DigoutMessageTrigger:
     """Send digout message on negative edge (true->false)"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DigoutSlot:
     slot_enabled: Annotated[bool, Signal(0, Boolean(False))]
     """Enable the digout slot"""
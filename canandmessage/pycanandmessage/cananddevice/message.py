@@ -5,7 +5,7 @@ from . import types as device_types
 from pycanandmessage.model import *
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanIdArbitrate(BaseMessage):
     """select conflicting device to use"""
     __meta__ = MessageMeta(device_type=31, id=0, min_length=8, max_length=8)
@@ -14,7 +14,7 @@ class CanIdArbitrate(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanIdError(BaseMessage):
     """can id conflict tx packet"""
     __meta__ = MessageMeta(device_type=31, id=1, min_length=8, max_length=8)
@@ -23,7 +23,7 @@ class CanIdError(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingCommand(BaseMessage):
     """setting control command"""
     __meta__ = MessageMeta(device_type=31, id=2, min_length=1, max_length=8)
@@ -34,7 +34,7 @@ class SettingCommand(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetSetting(BaseMessage):
     """update setting on device"""
     __meta__ = MessageMeta(device_type=31, id=3, min_length=8, max_length=8)
@@ -47,7 +47,7 @@ class SetSetting(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReportSetting(BaseMessage):
     """setting value report from device"""
     __meta__ = MessageMeta(device_type=31, id=4, min_length=8, max_length=8)
@@ -60,7 +60,7 @@ class ReportSetting(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ClearStickyFaults(BaseMessage):
     """Clear device sticky faults"""
     __meta__ = MessageMeta(device_type=31, id=5, min_length=0, max_length=8)
@@ -68,7 +68,7 @@ class ClearStickyFaults(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Status(BaseMessage):
     """Status frame"""
     __meta__ = MessageMeta(device_type=31, id=6, min_length=8, max_length=8)
@@ -77,7 +77,7 @@ class Status(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PartyMode(BaseMessage):
     """Party mode"""
     __meta__ = MessageMeta(device_type=31, id=7, min_length=1, max_length=8)
@@ -86,7 +86,7 @@ class PartyMode(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaData(BaseMessage):
     """Firmware update payload"""
     __meta__ = MessageMeta(device_type=31, id=8, min_length=8, max_length=8)
@@ -95,7 +95,7 @@ class OtaData(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaToHost(BaseMessage):
     """Firmware update response."""
     __meta__ = MessageMeta(device_type=31, id=9, min_length=8, max_length=8)
@@ -104,7 +104,7 @@ class OtaToHost(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaToDevice(BaseMessage):
     """Firmware update command."""
     __meta__ = MessageMeta(device_type=31, id=10, min_length=8, max_length=8)
@@ -113,7 +113,7 @@ class OtaToDevice(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Enumerate(BaseMessage):
     """Device enumerate response"""
     __meta__ = MessageMeta(device_type=31, id=11, min_length=8, max_length=8)
@@ -124,7 +124,7 @@ class Enumerate(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AtomicBondAnnouncement(BaseMessage):
     """Atomic bond announcement. Sent by gateway to control bus state, and by devices during negotiation."""
     __meta__ = MessageMeta(device_type=31, id=12, min_length=8, max_length=8)
@@ -137,7 +137,7 @@ class AtomicBondAnnouncement(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AtomicBondSpecification(BaseMessage):
     """Atomic bond specification. Sent by devices to announce capabilities."""
     __meta__ = MessageMeta(device_type=31, id=13, min_length=8, max_length=8)
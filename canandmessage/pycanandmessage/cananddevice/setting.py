@@ -9,7 +9,7 @@ from pycanandmessage.model import *
 __all__ = ['SettingType', 'CanId', 'Name0', 'Name1', 'Name2', 'StatusFramePeriod', 'SerialNumber', 'FirmwareVersion', 'ChickenBits', 'DeviceType', 'Scratch0', 'Scratch1']
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanId(BaseSetting):
     """CAN Device ID"""
     __meta__ = SettingMeta(idx=0x0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -17,7 +17,7 @@ class CanId(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name0(BaseSetting):
     """device_name[0:5]"""
     __meta__ = SettingMeta(idx=0x1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -25,7 +25,7 @@ class Name0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name1(BaseSetting):
     """device_name[6:11]"""
     __meta__ = SettingMeta(idx=0x2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -33,7 +33,7 @@ class Name1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name2(BaseSetting):
     """device_name[12:17]"""
     __meta__ = SettingMeta(idx=0x3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -41,7 +41,7 @@ class Name2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StatusFramePeriod(BaseSetting):
     """Status frame period (ms)"""
     __meta__ = SettingMeta(idx=0x4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -49,7 +49,7 @@ class StatusFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SerialNumber(BaseSetting):
     """Serial number"""
     __meta__ = SettingMeta(idx=0x5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -57,7 +57,7 @@ class SerialNumber(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion(BaseSetting):
     """Firmware version"""
     __meta__ = SettingMeta(idx=0x6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -65,7 +65,7 @@ class FirmwareVersion(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChickenBits(BaseSetting):
     """Device-specific chicken bits"""
     __meta__ = SettingMeta(idx=0x7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -73,7 +73,7 @@ class ChickenBits(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeviceType(BaseSetting):
     """Device-specific type identifier"""
     __meta__ = SettingMeta(idx=0x8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -81,7 +81,7 @@ class DeviceType(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch0(BaseSetting):
     """User-writable scratch bytes 1"""
     __meta__ = SettingMeta(idx=0x9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -89,7 +89,7 @@ class Scratch0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch1(BaseSetting):
     """User-writable scratch bytes 2"""
     __meta__ = SettingMeta(idx=0xa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -70,7 +70,7 @@ class AtomicAnnouncementFlags(enum.Flag):
     """Device should cease all transmission"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingFlags:
     ephemeral: Annotated[bool, Signal(0, Boolean(False))]
     """Whether the setting should be set ephemeral"""
@@ -80,7 +80,7 @@ class SettingFlags:
     """Synch message count"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion:
     firmware_patch: Annotated[int, Signal(0, UInt(width=8, min=0, max=255, default_value=0, factor_num=1, factor_den=1, offset=0))]
     """Firmware version patch number"""
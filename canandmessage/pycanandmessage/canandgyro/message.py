@@ -5,7 +5,7 @@ from . import types as device_types
 from pycanandmessage.model import *
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanIdArbitrate(BaseMessage):
     """select conflicting device to use"""
     __meta__ = MessageMeta(device_type=4, id=0, min_length=8, max_length=8)
@@ -14,7 +14,7 @@ class CanIdArbitrate(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanIdError(BaseMessage):
     """can id conflict tx packet"""
     __meta__ = MessageMeta(device_type=4, id=1, min_length=8, max_length=8)
@@ -23,7 +23,7 @@ class CanIdError(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingCommand(BaseMessage):
     """setting control command"""
     __meta__ = MessageMeta(device_type=4, id=2, min_length=1, max_length=8)
@@ -34,7 +34,7 @@ class SettingCommand(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetSetting(BaseMessage):
     """update setting on device"""
     __meta__ = MessageMeta(device_type=4, id=3, min_length=8, max_length=8)
@@ -47,7 +47,7 @@ class SetSetting(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReportSetting(BaseMessage):
     """setting value report from device"""
     __meta__ = MessageMeta(device_type=4, id=4, min_length=8, max_length=8)
@@ -60,7 +60,7 @@ class ReportSetting(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ClearStickyFaults(BaseMessage):
     """Clear device sticky faults"""
     __meta__ = MessageMeta(device_type=4, id=5, min_length=0, max_length=8)
@@ -68,7 +68,7 @@ class ClearStickyFaults(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Status(BaseMessage):
     """Status frame"""
     __meta__ = MessageMeta(device_type=4, id=6, min_length=8, max_length=8)
@@ -81,7 +81,7 @@ class Status(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PartyMode(BaseMessage):
     """Party mode"""
     __meta__ = MessageMeta(device_type=4, id=7, min_length=1, max_length=8)
@@ -90,7 +90,7 @@ class PartyMode(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaData(BaseMessage):
     """Firmware update payload"""
     __meta__ = MessageMeta(device_type=4, id=8, min_length=8, max_length=8)
@@ -99,7 +99,7 @@ class OtaData(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaToHost(BaseMessage):
     """Firmware update response."""
     __meta__ = MessageMeta(device_type=4, id=9, min_length=8, max_length=8)
@@ -108,7 +108,7 @@ class OtaToHost(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OtaToDevice(BaseMessage):
     """Firmware update command."""
     __meta__ = MessageMeta(device_type=4, id=10, min_length=8, max_length=8)
@@ -117,7 +117,7 @@ class OtaToDevice(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Enumerate(BaseMessage):
     """Device enumerate response"""
     __meta__ = MessageMeta(device_type=4, id=11, min_length=8, max_length=8)
@@ -128,7 +128,7 @@ class Enumerate(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AtomicBondAnnouncement(BaseMessage):
     """Atomic bond announcement. Sent by gateway to control bus state, and by devices during negotiation."""
     __meta__ = MessageMeta(device_type=4, id=12, min_length=8, max_length=8)
@@ -141,7 +141,7 @@ class AtomicBondAnnouncement(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AtomicBondSpecification(BaseMessage):
     """Atomic bond specification. Sent by devices to announce capabilities."""
     __meta__ = MessageMeta(device_type=4, id=13, min_length=8, max_length=8)
@@ -154,7 +154,7 @@ class AtomicBondSpecification(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class YawOutput(BaseMessage):
     """Yaw angle frame"""
     __meta__ = MessageMeta(device_type=4, id=31, min_length=6, max_length=6)
@@ -163,7 +163,7 @@ class YawOutput(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AngularPositionOutput(BaseMessage):
     """Angular position quaternion frame"""
     __meta__ = MessageMeta(device_type=4, id=30, min_length=8, max_length=8)
@@ -178,7 +178,7 @@ class AngularPositionOutput(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AngularVelocityOutput(BaseMessage):
     """Angular velocity frame"""
     __meta__ = MessageMeta(device_type=4, id=29, min_length=6, max_length=6)
@@ -191,7 +191,7 @@ class AngularVelocityOutput(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AccelerationOutput(BaseMessage):
     """Acceleration frame"""
     __meta__ = MessageMeta(device_type=4, id=28, min_length=6, max_length=6)
@@ -204,7 +204,7 @@ class AccelerationOutput(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Calibrate(BaseMessage):
     """Trigger Calibration"""
     __meta__ = MessageMeta(device_type=4, id=27, min_length=8, max_length=8)
@@ -213,7 +213,7 @@ class Calibrate(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CalibrationStatus(BaseMessage):
     """Calibration Status"""
     __meta__ = MessageMeta(device_type=4, id=26, min_length=8, max_length=8)
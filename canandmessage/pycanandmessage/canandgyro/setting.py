@@ -9,7 +9,7 @@ from pycanandmessage.model import *
 __all__ = ['SettingType', 'CanId', 'Name0', 'Name1', 'Name2', 'StatusFramePeriod', 'SerialNumber', 'FirmwareVersion', 'ChickenBits', 'DeviceType', 'Scratch0', 'Scratch1', 'YawFramePeriod', 'AngularPositionFramePeriod', 'AngularVelocityFramePeriod', 'AccelerationFramePeriod', 'SetYaw', 'SetPosePositiveW', 'SetPoseNegativeW', 'GyroXSensitivity', 'GyroYSensitivity', 'GyroZSensitivity', 'GyroXZroOffset', 'GyroYZroOffset', 'GyroZZroOffset', 'GyroZroOffsetTemperature', 'TemperatureCalibrationX0', 'TemperatureCalibrationY0', 'TemperatureCalibrationZ0', 'TemperatureCalibrationT0', 'TemperatureCalibrationX1', 'TemperatureCalibrationY1', 'TemperatureCalibrationZ1', 'TemperatureCalibrationT1']
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanId(BaseSetting):
     """CAN Device ID"""
     __meta__ = SettingMeta(idx=0x0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -17,7 +17,7 @@ class CanId(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name0(BaseSetting):
     """device_name[0:5]"""
     __meta__ = SettingMeta(idx=0x1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -25,7 +25,7 @@ class Name0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name1(BaseSetting):
     """device_name[6:11]"""
     __meta__ = SettingMeta(idx=0x2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -33,7 +33,7 @@ class Name1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name2(BaseSetting):
     """device_name[12:17]"""
     __meta__ = SettingMeta(idx=0x3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -41,7 +41,7 @@ class Name2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StatusFramePeriod(BaseSetting):
     """Status frame period (ms)"""
     __meta__ = SettingMeta(idx=0x4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -49,7 +49,7 @@ class StatusFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SerialNumber(BaseSetting):
     """Serial number"""
     __meta__ = SettingMeta(idx=0x5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -57,7 +57,7 @@ class SerialNumber(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion(BaseSetting):
     """Firmware version"""
     __meta__ = SettingMeta(idx=0x6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -65,7 +65,7 @@ class FirmwareVersion(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChickenBits(BaseSetting):
     """Device-specific chicken bits"""
     __meta__ = SettingMeta(idx=0x7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -73,7 +73,7 @@ class ChickenBits(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeviceType(BaseSetting):
     """Device-specific type identifier"""
     __meta__ = SettingMeta(idx=0x8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -81,7 +81,7 @@ class DeviceType(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch0(BaseSetting):
     """User-writable scratch bytes 1"""
     __meta__ = SettingMeta(idx=0x9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -89,7 +89,7 @@ class Scratch0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch1(BaseSetting):
     """User-writable scratch bytes 2"""
     __meta__ = SettingMeta(idx=0xa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -97,7 +97,7 @@ class Scratch1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class YawFramePeriod(BaseSetting):
     """Yaw angle frame period (ms)"""
     __meta__ = SettingMeta(idx=0xff, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -105,7 +105,7 @@ class YawFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AngularPositionFramePeriod(BaseSetting):
     """Angular position frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfe, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -113,7 +113,7 @@ class AngularPositionFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AngularVelocityFramePeriod(BaseSetting):
     """Angular velocity frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfd, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -121,7 +121,7 @@ class AngularVelocityFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AccelerationFramePeriod(BaseSetting):
     """Acceleration frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfc, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -129,7 +129,7 @@ class AccelerationFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetYaw(BaseSetting):
     """Set yaw"""
     __meta__ = SettingMeta(idx=0xfb, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -137,7 +137,7 @@ class SetYaw(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetPosePositiveW(BaseSetting):
     """Set (normed) quaternion assuming positive W"""
     __meta__ = SettingMeta(idx=0xfa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -145,7 +145,7 @@ class SetPosePositiveW(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SetPoseNegativeW(BaseSetting):
     """Set (normed) quaternion assuming negative W"""
     __meta__ = SettingMeta(idx=0xf9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -153,7 +153,7 @@ class SetPoseNegativeW(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroXSensitivity(BaseSetting):
     """Gyro X axis sensitivity"""
     __meta__ = SettingMeta(idx=0xf8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -161,7 +161,7 @@ class GyroXSensitivity(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroYSensitivity(BaseSetting):
     """Gyro Y axis sensitivity"""
     __meta__ = SettingMeta(idx=0xf7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -169,7 +169,7 @@ class GyroYSensitivity(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroZSensitivity(BaseSetting):
     """Gyro Z axis sensitivity"""
     __meta__ = SettingMeta(idx=0xf6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -177,7 +177,7 @@ class GyroZSensitivity(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroXZroOffset(BaseSetting):
     """Gyro X-axis calibrated ZRO offset"""
     __meta__ = SettingMeta(idx=0xf5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -185,7 +185,7 @@ class GyroXZroOffset(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroYZroOffset(BaseSetting):
     """Gyro Y-axis calibrated ZRO offset"""
     __meta__ = SettingMeta(idx=0xf4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -193,7 +193,7 @@ class GyroYZroOffset(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroZZroOffset(BaseSetting):
     """Gyro Z-axis calibrated ZRO offset"""
     __meta__ = SettingMeta(idx=0xf3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -201,7 +201,7 @@ class GyroZZroOffset(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GyroZroOffsetTemperature(BaseSetting):
     """Temperature at ZRO offset (celsius)"""
     __meta__ = SettingMeta(idx=0xf2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -209,7 +209,7 @@ class GyroZroOffsetTemperature(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationX0(BaseSetting):
     """Temp cal X-axis point 0"""
     __meta__ = SettingMeta(idx=0xe7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -217,7 +217,7 @@ class TemperatureCalibrationX0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationY0(BaseSetting):
     """Temp cal Y-axis point 0"""
     __meta__ = SettingMeta(idx=0xe6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -225,7 +225,7 @@ class TemperatureCalibrationY0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationZ0(BaseSetting):
     """Temp cal Z-axis point 0"""
     __meta__ = SettingMeta(idx=0xe5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -233,7 +233,7 @@ class TemperatureCalibrationZ0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationT0(BaseSetting):
     """Temp cal temperature point 0 (celsius)"""
     __meta__ = SettingMeta(idx=0xe4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -241,7 +241,7 @@ class TemperatureCalibrationT0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationX1(BaseSetting):
     """Temp cal X-axis point 1"""
     __meta__ = SettingMeta(idx=0xe3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -249,7 +249,7 @@ class TemperatureCalibrationX1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationY1(BaseSetting):
     """Temp cal Y-axis point 1"""
     __meta__ = SettingMeta(idx=0xe2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -257,7 +257,7 @@ class TemperatureCalibrationY1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationZ1(BaseSetting):
     """Temp cal Z-axis point 1"""
     __meta__ = SettingMeta(idx=0xe1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -265,7 +265,7 @@ class TemperatureCalibrationZ1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TemperatureCalibrationT1(BaseSetting):
     """Temp cal temperature point 1 (celsius)"""
     __meta__ = SettingMeta(idx=0xe0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
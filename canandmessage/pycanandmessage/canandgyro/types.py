@@ -156,7 +156,7 @@ class Faults(enum.Flag):
     """
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingFlags:
     ephemeral: Annotated[bool, Signal(0, Boolean(False))]
     """Whether the setting should be set ephemeral"""
@@ -166,7 +166,7 @@ class SettingFlags:
     """Synch message count"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion:
     firmware_patch: Annotated[int, Signal(0, UInt(width=8, min=0, max=255, default_value=0, factor_num=1, factor_den=1, offset=0))]
     """Firmware version patch number"""
@@ -176,7 +176,7 @@ class FirmwareVersion:
     """Firmware version year"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TempCalPoint:
     temperature_point: Annotated[int, Signal(0, SInt(width=16, min=-32768, max=32767, default_value=0, factor_num=1, factor_den=256, offset=0))]
     """Temperature point"""
@@ -184,7 +184,7 @@ class TempCalPoint:
     """Offset at the temperature"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class QuatXyz:
     x: Annotated[int, Signal(0, SInt(width=16, min=-32767, max=32767, default_value=0, factor_num=1, factor_den=32767, offset=0))]
     """Quaternion x term"""
@@ -194,7 +194,7 @@ class QuatXyz:
     """Quaternion z term"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Yaw:
     yaw: Annotated[float, Signal(0, Float(width=32, min=None, max=None, default_value=0, allow_nan_inf=True, factor_num=1, factor_den=1, offset=0))]
     """Yaw angle (f32 between [-pi..pi) radians)"""
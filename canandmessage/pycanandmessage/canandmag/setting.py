@@ -9,7 +9,7 @@ from pycanandmessage.model import *
 __all__ = ['SettingType', 'CanId', 'Name0', 'Name1', 'Name2', 'StatusFramePeriod', 'SerialNumber', 'FirmwareVersion', 'ChickenBits', 'DeviceType', 'Scratch0', 'Scratch1', 'ZeroOffset', 'VelocityWindow', 'PositionFramePeriod', 'VelocityFramePeriod', 'RawPositionFramePeriod', 'InvertDirection', 'RelativePosition', 'DisableZeroButton']
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CanId(BaseSetting):
     """CAN Device ID"""
     __meta__ = SettingMeta(idx=0x0, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -17,7 +17,7 @@ class CanId(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name0(BaseSetting):
     """device_name[0:5]"""
     __meta__ = SettingMeta(idx=0x1, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -25,7 +25,7 @@ class Name0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name1(BaseSetting):
     """device_name[6:11]"""
     __meta__ = SettingMeta(idx=0x2, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -33,7 +33,7 @@ class Name1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Name2(BaseSetting):
     """device_name[12:17]"""
     __meta__ = SettingMeta(idx=0x3, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -41,7 +41,7 @@ class Name2(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StatusFramePeriod(BaseSetting):
     """Status frame period (ms)"""
     __meta__ = SettingMeta(idx=0x4, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -49,7 +49,7 @@ class StatusFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SerialNumber(BaseSetting):
     """Serial number"""
     __meta__ = SettingMeta(idx=0x5, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -57,7 +57,7 @@ class SerialNumber(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion(BaseSetting):
     """Firmware version"""
     __meta__ = SettingMeta(idx=0x6, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -65,7 +65,7 @@ class FirmwareVersion(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChickenBits(BaseSetting):
     """Device-specific chicken bits"""
     __meta__ = SettingMeta(idx=0x7, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -73,7 +73,7 @@ class ChickenBits(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DeviceType(BaseSetting):
     """Device-specific type identifier"""
     __meta__ = SettingMeta(idx=0x8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -81,7 +81,7 @@ class DeviceType(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch0(BaseSetting):
     """User-writable scratch bytes 1"""
     __meta__ = SettingMeta(idx=0x9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -89,7 +89,7 @@ class Scratch0(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Scratch1(BaseSetting):
     """User-writable scratch bytes 2"""
     __meta__ = SettingMeta(idx=0xa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -97,7 +97,7 @@ class Scratch1(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ZeroOffset(BaseSetting):
     """Encoder zero offset"""
     __meta__ = SettingMeta(idx=0xff, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -105,7 +105,7 @@ class ZeroOffset(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VelocityWindow(BaseSetting):
     """Velocity window width (value*250us)"""
     __meta__ = SettingMeta(idx=0xfe, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -113,7 +113,7 @@ class VelocityWindow(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PositionFramePeriod(BaseSetting):
     """Position frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfd, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -121,7 +121,7 @@ class PositionFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VelocityFramePeriod(BaseSetting):
     """Velocity frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfc, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -129,7 +129,7 @@ class VelocityFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RawPositionFramePeriod(BaseSetting):
     """Raw position frame period (ms)"""
     __meta__ = SettingMeta(idx=0xfb, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -137,7 +137,7 @@ class RawPositionFramePeriod(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class InvertDirection(BaseSetting):
     """Invert direction (0=ccw, 1=cw)"""
     __meta__ = SettingMeta(idx=0xfa, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -145,7 +145,7 @@ class InvertDirection(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RelativePosition(BaseSetting):
     """Set relative position value"""
     __meta__ = SettingMeta(idx=0xf9, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -153,7 +153,7 @@ class RelativePosition(BaseSetting):
     """Setting value"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DisableZeroButton(BaseSetting):
     """Disable the zero button"""
     __meta__ = SettingMeta(idx=0xf8, set_setting=message.SetSetting, report_setting=message.ReportSetting, stg_flags=device_types.SettingFlags)
@@ -118,7 +118,7 @@ class Faults(enum.Flag):
     """
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SettingFlags:
     ephemeral: Annotated[bool, Signal(0, Boolean(False))]
     """Whether the setting should be set ephemeral"""
@@ -128,7 +128,7 @@ class SettingFlags:
     """Synch message count"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class FirmwareVersion:
     firmware_patch: Annotated[int, Signal(0, UInt(width=8, min=0, max=255, default_value=0, factor_num=1, factor_den=1, offset=0))]
     """Firmware version patch number"""
@@ -138,7 +138,7 @@ class FirmwareVersion:
     """Firmware version year"""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ZeroOffset:
     offset_or_position: Annotated[int, Signal(0, UInt(width=14, min=0, max=16383, default_value=0, factor_num=1, factor_den=16384, offset=0))]
     """Zero offset or position"""
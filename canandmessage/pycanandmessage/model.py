@@ -4,6 +4,7 @@ from typing import Annotated
 import enum
 import math
 import struct
+import functools
 from . import utils
 
 import can
@@ -158,28 +159,78 @@ class SettingMeta:
     stg_flags: typing.Type
 
 
+@functools.cache
+def signal_layout(cls: typing.Type) -> typing.Tuple[typing.Tuple[str, 'Signal'], ...]:
+    """(field name, Signal) for each Annotated signal field of cls, read from its type hints once per class"""
+    layout = []
+    for name, hint in typing.get_type_hints(cls, include_extras=True).items():
+        if not typing.get_origin(hint) is typing.Annotated:
+            continue
+        sig = hint.__metadata__[0]
+        if not isinstance(sig, Signal):
+            raise TypeError("signal annotation should be Signal")
+        layout.append((name, sig))
+    return tuple(layout)
+
+@functools.cache
+def signal_decoder(cls: typing.Type) -> typing.Callable[[int, int], typing.Any]:
+    """
+    Builds decode(data, max_idx) -> cls for cls's signal layout, with each field's offset and mask written into
+    the generated source as literals. Integer (signed included) and boolean fields are extracted inline; anything
+    else defers to Signal.decode.
+    """
+    namespace = {"_cls": cls}
+    fields = []
+    for i, (name, sig) in enumerate(signal_layout(cls)):
+        if sig._plain_int:
+            expr = f"((data >> {sig.offset}) & {sig._mask:#x}) if {sig.offset} <= max_idx else None"
+        elif sig._bool_bit is not None:
+            expr = f"((data & {sig._bool_bit:#x}) != 0) if {sig.offset} <= max_idx else None"
+        elif type(sig.meta) is SInt:
+            # branchless sign extension: flip the sign bit, then subtract its weight
+            sign = (sig._mask >> 1) + 1
+            expr = f"((((data >> {sig.offset}) & {sig._mask:#x}) ^ {sign:#x}) - {sign:#x}) if {sig.offset} <= max_idx else None"
+        else:
+            namespace[f"_sig{i}"] = sig
+            expr = f"_sig{i}.decode(data, max_idx)"
+        fields.append(f"        {name}={expr},\n")
+    src = f"def decode(data, max_idx):\n    return _cls(\n{''.join(fields)}    )\n"
+    exec(src, namespace)
+    return namespace["decode"]
+
 class Signal:
     def __init__(self, offset: int, meta, optional=False):
         self.offset: int = offset
         self.meta = meta
         self.optional = optional
+        # masks are fixed by the signal's width, so work them out once here instead of on every decode/encode
+        width = getattr(meta, "width", None)
+        self._mask: int | None = None if width is None else utils.mask(width)
+        # unsigned, bitset and enum fields all decode to a plain masked int
+        self._plain_int: bool = type(meta) in (UInt, Bitset, Enum)
+        # booleans test their bit in place rather than shifting the frame down first
+        self._bool_bit: int | None = (1 << offset) if type(meta) is Boolean else None
     
     def decode(self, data: int, max_idx: int):
         if self.offset > max_idx:
             return None
+        if self._plain_int:
+            return (data >> self.offset) & self._mask
+        if self._bool_bit is not None:
+            return (data & self._bool_bit) != 0
         
         data = data >> self.offset
         meta = self.meta
         match meta:
             case UInt():
-                return data & utils.mask(meta.width)
+                return data & self._mask
             case SInt():
-                value = data & utils.mask(meta.width)
-                return (value - (1 << meta.width)) if value >= (1 << (meta.width - 1)) else value
+                value = data & self._mask
+                return (value - (1 << meta.width)) if value > (self._mask >> 1) else value
             case Boolean():
                 return bool(data & 0b1)
             case Float():
-                data = data & utils.mask(meta.width)
+                data = data & self._mask
                 match meta.width:
                     case 24:
                         data = (data & 0xffffff) << 8
@@ -191,28 +242,17 @@ class Signal:
                     case _:
                         raise ValueError(f"Float({meta.width}) invalid size!!!")
             case Buffer():
-                data = data & utils.mask(meta.width)
+                data = data & self._mask
                 return bytearray(data.to_bytes((meta.width + 7) // 8, 'little'))
             
             case Bitset():
-                return data & utils.mask(meta.width)
+                return data & self._mask
             
             case Enum():
-                return data & utils.mask(meta.width)
+                return data & self._mask
             
             case Struct():
-                max_idx -= self.offset
-                subsig_data = {}
-                for subsig_name, subsig_hint in typing.get_type_hints(meta.dtype, include_extras=True).items():
-                    if not typing.get_origin(subsig_hint) is typing.Annotated:
-                        continue
-                    subsig = subsig_hint.__metadata__[0]
-                    if not isinstance(subsig, Signal):
-                        raise TypeError("signal annotation should be Signal")
-                    
-                    subsig_data[subsig_name] = subsig.decode(data, max_idx)
-                
-                return meta.dtype(**subsig_data)
+                return signal_decoder(meta.dtype)(data, max_idx - self.offset)
 
     
     def encode(self, name: str, value) -> int:
@@ -229,7 +269,7 @@ class Signal:
                 if not (min_bound <= value <= max_bound):
                     raise ValueError(f"{name} out of bounds for {min_bound} <= {value} <= {max_bound}")
                 
-                ivalue = value & utils.mask(meta.width)
+                ivalue = value & self._mask
 
             case SInt():
                 value = int(value)
@@ -237,7 +277,7 @@ class Signal:
                 max_bound = utils.unwrap_or(meta.max, utils.default_sint_max(meta.width))
                 if not (min_bound <= value <= max_bound):
                     raise ValueError(f"{name} out of bounds for {min_bound} <= {value} <= {max_bound}")
-                ivalue = value & utils.mask(meta.width)
+                ivalue = value & self._mask
             case Boolean():
                 ivalue = bool(value)
             case Float():
@@ -275,18 +315,15 @@ class Signal:
 
             case Struct():
                 ivalue = 0
-                for subsig_name, subsig_hint in typing.get_type_hints(meta.dtype, include_extras=True).items():
-                    if not typing.get_origin(subsig_hint) is typing.Annotated:
-                        continue
-                    subsig = subsig_hint.__metadata__[0]
-                    if not isinstance(subsig, Signal):
-                        raise TypeError("signal annotation should be Signal")
+                for subsig_name, subsig in signal_layout(meta.dtype):
                     subsig_value = getattr(value, subsig_name)
                     ivalue |= subsig.encode(f"{name}.{subsig_name}", subsig_value)
 
         return ivalue << self.offset
 
 class BaseMessage:
+    # empty so the generated slotted message dataclasses don't pick up a __dict__ from here
+    __slots__ = ()
     __meta__: MessageMeta
     def to_wrapper(self, dev_id: int, device_type: int = None) -> MessageWrapper:
         if device_type is None:
@@ -294,15 +331,7 @@ class BaseMessage:
 
         dlc = self.__meta__.min_length
         data = 0
-        for name, hint in typing.get_type_hints(self, include_extras=True).items():
-
-            if not typing.get_origin(hint) is typing.Annotated:
-                continue
-            sig = hint.__metadata__[0]
-
-            if not isinstance(sig, Signal):
-                raise TypeError("signal annotation should be Signal")
-            
+        for name, sig in signal_layout(type(self)):
             value = getattr(self, name)
             if sig.optional: 
                 if value is not None:
@@ -314,31 +343,15 @@ class BaseMessage:
     
     @classmethod
     def from_wrapper(cls, msg: MessageWrapper) -> typing.Optional[typing.Self]:
-        data = msg.data
-        max_idx = msg.dlc * 8
-
-        subsig_data = {}
-        for subsig_name, subsig_hint in typing.get_type_hints(cls, include_extras=True).items():
-            if not typing.get_origin(subsig_hint) is typing.Annotated:
-                continue
-            subsig = subsig_hint.__metadata__[0]
-            if not isinstance(subsig, Signal):
-                raise TypeError("signal annotation should be Signal")
-            subsig_data[subsig_name] = subsig.decode(data, max_idx)
-        
-        return cls(**subsig_data)
+        return signal_decoder(cls)(msg.data, msg.dlc * 8)
 
 class BaseSetting:
+    __slots__ = ()
     __meta__: SettingMeta
 
     def encode(self) -> typing.ByteString:
         data = 0
-        for name, hint in typing.get_type_hints(self, include_extras=True).items():
-            if not typing.get_origin(hint) is typing.Annotated:
-                continue
-            sig = hint.__metadata__[0]
-            if not isinstance(sig, Signal):
-                raise TypeError("signal annotation should be Signal")
+        for name, sig in signal_layout(type(self)):
             value = getattr(self, name)
             data |= sig.encode(name, value)
 
@@ -346,18 +359,7 @@ class BaseSetting:
     
     @classmethod
     def decode(cls, data: typing.ByteString) -> typing.Self:
-        data = int.from_bytes(data[:6], 'little')
-        sig_data = {}
-        for subsig_name, subsig_hint in typing.get_type_hints(cls, include_extras=True).items():
-            if not typing.get_origin(subsig_hint) is typing.Annotated:
-                continue
-            subsig = subsig_hint.__metadata__[0]
-            if not isinstance(subsig, Signal):
-                raise TypeError("signal annotation should be Signal")
-            
-            sig_data[subsig_name] = subsig.decode(data, 48)
-        
-        return cls(**sig_data)
+        return signal_decoder(cls)(int.from_bytes(data[:6], 'little'), 48)
     
     def to_wrapper(self, dev_id: int, ephemeral=False, synch_hold=False, synch_cnt=0) -> MessageWrapper:
         self.__meta__.set_setting(
@@ -371,6 +373,18 @@ class BaseDevice:
     name: str
     messages: typing.Dict[int, typing.Type[BaseMessage]]
     settings: typing.Dict[int, typing.Type[BaseSetting]]
+    @classmethod
+    def _message_table(cls) -> typing.Tuple[typing.Optional[typing.Type[BaseMessage]], ...]:
+        # message ids are 8 bits, so decoding can index a flat table rather than probe the dict.
+        # built from messages on first decode, so it sees a messages mapping assigned after the class body
+        table = cls.__dict__.get("_message_table_cache")
+        if table is None:
+            entries = [None] * 256
+            for msg_id, msg_cls in cls.messages.items():
+                if 0 <= msg_id < 256:
+                    entries[msg_id] = msg_cls
+            table = cls._message_table_cache = tuple(entries)
+        return table
 
     @classmethod
     def decode_msg_generic(cls, msg: MessageWrapper) -> BaseMessage | None:
@@ -378,9 +392,13 @@ class BaseDevice:
         if (arb_id & 0x1fff0000) != ((cls.device_type << 24) | (0xe << 16)):
             return None
         msg_id = (arb_id >> 6) & 0xff
-        if msg_id not in cls.messages:
-            return None
-        return cls.messages[msg_id].from_wrapper(msg)
+        msg_cls = cls._message_table()[msg_id]
+        if msg_cls is None:
+            # messages added to the dict after the table was built still decode
+            msg_cls = cls.messages.get(msg_id)
+            if msg_cls is None:
+                return None
+        return msg_cls.from_wrapper(msg)
 
 
 @dataclasses.dataclass
@@ -5,7 +5,7 @@ from . import types as device_types
 from pycanandmessage.model import *
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EnumerateRequest(BaseMessage):
     """Enumerate request"""
     __meta__ = MessageMeta(device_type=0, id=0, min_length=0, max_length=8)
@@ -13,7 +13,7 @@ class EnumerateRequest(BaseMessage):
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimesyncRequest(BaseMessage):
     """force a timesync"""
     __meta__ = MessageMeta(device_type=0, id=1, min_length=0, max_length=8)